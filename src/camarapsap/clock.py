@@ -0,0 +1,23 @@
+"""Coarse wall-clock helpers for hot request paths."""
+
+import time
+from datetime import datetime, timezone
+
+# Last whole second seen and the datetime built for it
+_cached_second: int = -1
+_cached_now: datetime = datetime.fromtimestamp(0, tz=timezone.utc)
+
+
+def utcnow() -> datetime:
+    """Return the current UTC time at one-second resolution.
+
+    Requests within the same second share one timezone-aware datetime object
+    instead of each allocating their own. Suitable for informational
+    timestamps such as ``lastLocationTime``; not for measuring durations.
+    """
+    global _cached_second, _cached_now
+    second = int(time.time())
+    if second != _cached_second:
+        _cached_now = datetime.fromtimestamp(second, tz=timezone.utc)
+        _cached_second = second
+    return _cached_now
@@ -1,8 +1,22 @@
 """Database package for CamaraPSAP."""
 
+from typing import TYPE_CHECKING, Any
+
 from .database import Base, engine, AsyncSessionLocal, get_db
-from .models.device import Device
-from .models.location import Location
-from .models.client import Client
+
+if TYPE_CHECKING:
+    from .models.device import Device
+    from .models.location import Location
+    from .models.client import Client
 
 __all__ = ["Base", "engine", "AsyncSessionLocal", "get_db", "Device", "Location", "Client"]
+
+_LAZY_MODELS = {"Device", "Location", "Client"}
+
+
+def __getattr__(name: str) -> Any:
+    # Defer model imports (and mapper setup) until a model is actually used
+    if name in _LAZY_MODELS:
+        from . import models
+        return getattr(models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,12 @@
 """Database configuration and session management."""
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
+from sqlalchemy import DateTime
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement
 from ..config import settings
 
 # Database URL - using PostgreSQL with async driver
@@ -13,7 +17,18 @@ ASYNC_DATABASE_URL = DATABASE_URL.replace('postgresql://', 'postgresql+asyncpg:/
 # Create async engine
 engine = create_async_engine(
     ASYNC_DATABASE_URL,
-    echo=True  # Set to False in production
+    echo=settings.sql_echo,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    connect_args={
+        "statement_cache_size": settings.db_statement_cache_size,
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+        # Short OLTP lookups never benefit from JIT; avoid its first-use compile stall
+        "server_settings": {"jit": "off"},
+    },
 )
 
 # Create async session factory
@@ -30,6 +45,27 @@ class Base(DeclarativeBase):
     pass
 
 
+class utc_timestamp(FunctionElement[Any]):
+    """Current UTC time computed by the database, as a naive timestamp.
+    
+    ``now()`` follows the session time zone, so timestamp defaults would be
+    written in server-local time on a non-UTC server.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utc_timestamp, "postgresql")
+def _utc_timestamp_postgresql(element: utc_timestamp, compiler: SQLCompiler, **kw: Any) -> str:
+    return "timezone('utc', now())"
+
+
+@compiles(utc_timestamp)
+def _utc_timestamp_default(element: utc_timestamp, compiler: SQLCompiler, **kw: Any) -> str:
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency to get async database session."""
     async with AsyncSessionLocal() as session:
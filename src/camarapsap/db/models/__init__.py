@@ -1,8 +1,33 @@
 """Database models package."""
 
-from .device import Device
-from .location import Location
-from .client import Client
-from .device_ppid import DevicePPID
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .device import Device
+    from .location import Location
+    from .client import Client
+    from .device_ppid import DevicePPID
 
 __all__ = ["Device", "Location", "Client", "DevicePPID"]
+
+# Model name -> defining submodule, imported on first access (PEP 562)
+_LAZY_MODELS = {
+    "Device": ".device",
+    "Location": ".location",
+    "Client": ".client",
+    "DevicePPID": ".device_ppid",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_MODELS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    # Relationships refer to each other by class name, so the whole model
+    # graph is registered together the first time any model is requested
+    for model_name, module_name in _LAZY_MODELS.items():
+        module = importlib.import_module(module_name, __name__)
+        globals()[model_name] = getattr(module, model_name)
+    
+    return globals()[name]
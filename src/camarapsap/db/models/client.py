@@ -1,7 +1,8 @@
 """Client application model for OAuth 2.0."""
 
 from typing import List
-from sqlalchemy import String, Boolean, ARRAY
+from sqlalchemy import String, Boolean, BigInteger
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import TYPE_CHECKING
 
@@ -15,11 +16,16 @@ class Client(Base):
     """OAuth 2.0 client application."""
     
     __tablename__ = "clients"
+    # Primary key is supplied by the caller, so INSERTs never need RETURNING
+    __table_args__ = {"implicit_returning": False}
     
     client_id: Mapped[str] = mapped_column(String(255), primary_key=True, index=True)
     client_secret_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     client_name: Mapped[str] = mapped_column(String(255), nullable=False)
-    allowed_scopes: Mapped[List[str]] = mapped_column(ARRAY(String), nullable=False, default=[])
+    # JSONB array: asyncpg decodes it with a single json.loads instead of text-array parsing
+    allowed_scopes: Mapped[List[str]] = mapped_column(JSONB, nullable=False, default=list)
+    # Same scopes encoded as a bitmask (see Scope.mask) for single-AND scope checks
+    allowed_scope_mask: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     
     # Relationships
@@ -1,27 +1,62 @@
 """Device database model."""
 
 from datetime import datetime, timezone
+from functools import partial
 from typing import Optional, TYPE_CHECKING, List
-from sqlalchemy import String, Integer, DateTime
+from sqlalchemy import String, Integer, DateTime, Index, Computed, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
     from .location import Location
     from .device_ppid import DevicePPID
 
-from ..database import Base
+from ..database import Base, utc_timestamp
+
+# Current UTC time, for columns that need a client-side timestamp
+_utcnow = partial(datetime.now, timezone.utc)
+
+# The columns device lookups load (services/device_lookup.py selects exactly
+# these), carried in the lookup indexes so PostgreSQL can answer them with
+# index-only scans. New columns stay out of both until a lookup needs them.
+LOOKUP_COLUMNS = (
+    "id", "phone_number", "network_access_identifier",
+    "ipv4_public_address", "ipv4_private_address", "ipv4_public_port",
+    "imei", "tac", "imeisv", "manufacturer", "model", "last_checked",
+)
+
+
+def _lookup_index(name: str, *keys: str, unique: bool = False) -> Index:
+    """Partial covering index for a device lookup on the given key columns."""
+    return Index(
+        name,
+        *keys,
+        unique=unique,
+        postgresql_include=[c for c in LOOKUP_COLUMNS if c not in keys],
+        # Lookups always bind a value, so rows without this identifier never match
+        postgresql_where=text(f"{keys[0]} IS NOT NULL"),
+    )
 
 
 class Device(Base):
     """Device table storing device information."""
     
     __tablename__ = "devices"
+    __table_args__ = (
+        _lookup_index("ix_devices_phone_number", "phone_number", unique=True),
+        _lookup_index("ix_devices_network_access_identifier", "network_access_identifier", unique=True),
+        # Matches IPv4 lookups, which identify a device by public address + port
+        _lookup_index("ix_devices_ipv4_pub_port", "ipv4_public_address", "ipv4_public_port"),
+    )
+    # Read the database-generated timestamps back in the INSERT/UPDATE itself;
+    # left expired, they would lazy-load (unsupported under AsyncSession)
+    __mapper_args__ = {"eager_defaults": True}
     
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     
     # Device identifiers
-    phone_number: Mapped[Optional[str]] = mapped_column(String(20), unique=True, index=True, nullable=True)
-    network_access_identifier: Mapped[Optional[str]] = mapped_column(String(255), unique=True, index=True, nullable=True)
+    # Uniqueness is enforced by the partial lookup indexes in __table_args__
+    phone_number: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    network_access_identifier: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     ipv4_public_address: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)
     ipv4_private_address: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)
     ipv4_public_port: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
@@ -29,23 +64,20 @@ class Device(Base):
     
     # Device details
     imei: Mapped[str] = mapped_column(String(15), nullable=False)
+    # Type Allocation Code - first 8 digits of IMEI, maintained by the database
+    tac: Mapped[str] = mapped_column(String(8), Computed("substring(imei, 1, 8)", persisted=True), index=True)
     imeisv: Mapped[Optional[str]] = mapped_column(String(16), nullable=True)
     manufacturer: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     model: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     
     # Metadata
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
-    last_checked: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utc_timestamp())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=utc_timestamp(), onupdate=utc_timestamp())
+    last_checked: Mapped[datetime] = mapped_column(DateTime, default=_utcnow, nullable=False)
     
     # Relationships
     locations: Mapped[List["Location"]] = relationship("Location", back_populates="device", cascade="all, delete-orphan", lazy="select")
     ppids: Mapped[List["DevicePPID"]] = relationship("DevicePPID", back_populates="device", cascade="all, delete-orphan", lazy="select")
     
-    @property
-    def tac(self) -> str:
-        """Type Allocation Code - first 8 digits of IMEI."""
-        return self.imei[:8]
-    
     def __repr__(self) -> str:
         return f"<Device(id={self.id}, phone={self.phone_number}, imei={self.imei})>"
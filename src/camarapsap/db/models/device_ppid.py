@@ -20,6 +20,8 @@ class DevicePPID(Base):
     """
     
     __tablename__ = "device_ppids"
+    # Composite primary key is supplied by the caller, so INSERTs never need RETURNING
+    __table_args__ = {"implicit_returning": False}
     
     device_id: Mapped[int] = mapped_column(
         ForeignKey("devices.id", ondelete="CASCADE"),
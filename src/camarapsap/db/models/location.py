@@ -1,20 +1,23 @@
 """Location database model."""
 
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional, TYPE_CHECKING
-from sqlalchemy import String, Float, Integer, DateTime, ForeignKey, JSON
+from sqlalchemy import String, Float, Integer, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
     from .device import Device
 
-from ..database import Base
+from ..database import Base, utc_timestamp
 
 
 class Location(Base):
     """Location table storing device location information."""
     
     __tablename__ = "locations"
+    # Fetch created_at in the INSERT so it never needs a lazy load
+    __mapper_args__ = {"eager_defaults": True}
     
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     device_id: Mapped[int] = mapped_column(ForeignKey("devices.id"), index=True)
@@ -27,11 +30,11 @@ class Location(Base):
     center_longitude: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     radius: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     
-    # Polygon location data (stored as JSON array of points)
-    boundary: Mapped[Optional[str]] = mapped_column(JSON, nullable=True)
+    # Polygon location data (stored as binary JSONB array of points)
+    boundary: Mapped[Optional[str]] = mapped_column(JSONB, nullable=True)
     
     # Metadata
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=utc_timestamp())
     
     # Relationships
     device: Mapped["Device"] = relationship("Device", back_populates="locations")
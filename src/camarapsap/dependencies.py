@@ -1,18 +1,50 @@
 """FastAPI dependencies for authentication and authorization."""
 
-from typing import Optional, Callable, Awaitable
-from fastapi import Depends, HTTPException, status
+from datetime import datetime
+from typing import Annotated, Optional, Callable, Awaitable
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
+from .clock import utcnow
 from .services.authorization import AuthorizationService
+from .services.redis_client import redis_client
 from .models.auth import AccessToken, Scope
+from .models.common.x_correlator import X_CORRELATOR_PATTERN
 
 
-# HTTP Bearer token security scheme
+# HTTP Bearer token security schemes
 security = HTTPBearer()
+security_optional = HTTPBearer(auto_error=False)
 
-# Shared authorization service instance
-auth_service = AuthorizationService()
+# The process's single authorization service: oauth.py issues and revokes
+# through it too, so its token cache and revocation mirror are shared
+auth_service = AuthorizationService(redis_client=redis_client)
+
+# Optional x-correlator header, validated by pydantic-core along with the request
+XCorrelatorHeader = Annotated[
+    Optional[str],
+    Header(
+        alias="x-correlator",
+        max_length=256,
+        pattern=X_CORRELATOR_PATTERN,
+        description="Correlation id for the different services",
+    ),
+]
+
+
+
+async def get_request_time() -> datetime:
+    """Timestamp for the current request.
+    
+    FastAPI resolves a dependency once per request, so every consumer in the
+    request shares one value. Async so resolving it never hops to the
+    threadpool.
+    """
+    return utcnow()
+
+
+# Request-scoped "now"
+RequestTime = Annotated[datetime, Depends(get_request_time)]
 
 
 async def get_current_token(
@@ -54,8 +86,10 @@ def require_scope(required_scope: Scope) -> Callable[[AccessToken], Awaitable[Ac
     Returns:
         A dependency function that validates the scope
     """
+    required_mask = required_scope.mask
+    
     async def scope_checker(token: AccessToken = Depends(get_current_token)) -> AccessToken:
-        if not token.has_scope(required_scope.value):
+        if not token.scope_mask & required_mask:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Token missing required scope: {required_scope.value}",
@@ -66,7 +100,7 @@ def require_scope(required_scope: Scope) -> Callable[[AccessToken], Awaitable[Ac
 
 
 async def get_current_token_optional(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False))
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security_optional)
 ) -> Optional[AccessToken]:
     """
     Extract and validate the access token if present (optional authentication).
@@ -1,10 +1,11 @@
 """Device Identifier API endpoints."""
 
-from fastapi import APIRouter, HTTPException, Header, Depends
-from typing import Optional, Annotated
+from fastapi import HTTPException, Depends, Response
+from typing import Annotated
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from .config import settings
+from .routing import FlatAPIRouter
 from .models.auth import AccessToken
 from .models.common.device import Device
 from .models.device_identifier import (
@@ -12,6 +13,7 @@ from .models.device_identifier import (
     DeviceIdentifier,
     DeviceType,
     DevicePPID,
+    dump_identifier_response,
 )
 from .models.error_models.camara_errors import (
     Error400,
@@ -20,19 +22,22 @@ from .models.error_models.camara_errors import (
     Error404,
     Error422,
     Error429,
+    MISSING_IDENTIFIER,
+    UNAUTHENTICATED,
+    UNNECESSARY_IDENTIFIER,
 )
 from .services.identifier import DeviceIdentifierService
 from .db.database import get_db
-from .dependencies import get_current_token
+from .dependencies import XCorrelatorHeader, get_current_token
 
-router = APIRouter(
+router = FlatAPIRouter(
     prefix=f"/device-identifier/{settings.device_version_id}",
     tags=["Get Device Identifiers"]
 )
 
 # Reusable dependency annotations
 CurrentToken = Annotated[AccessToken, Depends(get_current_token)]
-DatabaseSession = Annotated[Session, Depends(get_db)]
+DatabaseSession = Annotated[AsyncSession, Depends(get_db)]
 
 def get_identifier_service(db: DatabaseSession) -> DeviceIdentifierService:
     """Create a DeviceIdentifierService instance."""
@@ -45,7 +50,7 @@ def _validate_device_xor_token(request: RequestBody, token: AccessToken) -> Devi
         raise HTTPException(
             status_code=422,
             detail={
-                "code": "UNNECESSARY_IDENTIFIER",
+                "code": UNNECESSARY_IDENTIFIER,
                 "message": "Device identifier cannot be provided when token contains device info"
             }
         )
@@ -54,7 +59,7 @@ def _validate_device_xor_token(request: RequestBody, token: AccessToken) -> Devi
         raise HTTPException(
             status_code=422,
             detail={
-                "code": "MISSING_IDENTIFIER",
+                "code": MISSING_IDENTIFIER,
                 "message": "Device identifier must be provided"
             }
         )
@@ -62,6 +67,7 @@ def _validate_device_xor_token(request: RequestBody, token: AccessToken) -> Devi
 
 @router.post(
     "/retrieve-identifier",
+    response_model=DeviceIdentifier,
     responses={
         400: {"model": Error400, "description": "Bad Request"},
         401: {"model": Error401, "description": "Unauthorized"},
@@ -75,8 +81,8 @@ async def retrieve_identifier(
     request: RequestBody,
     token: CurrentToken,
     service: IdentifierService,
-    x_correlator: Optional[str] = Header(None, alias="x-correlator")
-) -> DeviceIdentifier:
+    x_correlator: XCorrelatorHeader = None
+) -> Response:
     """
     Get details about the specific device being used by a given mobile subscriber.
     
@@ -92,11 +98,15 @@ async def retrieve_identifier(
     """
     device = _validate_device_xor_token(request, token)
     
-    return service.retrieve_identifier(device)
+    return Response(
+        content=await service.retrieve_identifier_json(device),
+        media_type="application/json",
+    )
 
 
 @router.post(
     "/retrieve-type",
+    response_model=DeviceType,
     responses={
         400: {"model": Error400, "description": "Bad Request"},
         401: {"model": Error401, "description": "Unauthorized"},
@@ -110,8 +120,8 @@ async def retrieve_type(
     request: RequestBody,
     token: CurrentToken,
     service: IdentifierService,
-    x_correlator: Optional[str] = Header(None, alias="x-correlator")
-) -> DeviceType:
+    x_correlator: XCorrelatorHeader = None
+) -> Response:
     """
     Get details about the type of device being used by a given mobile subscriber.
     
@@ -127,11 +137,15 @@ async def retrieve_type(
     """
     device = _validate_device_xor_token(request, token)
 
-    return service.retrieve_type(device)
+    return Response(
+        content=await service.retrieve_type_json(device),
+        media_type="application/json",
+    )
 
 
 @router.post(
     "/retrieve-ppid",
+    response_model=DevicePPID,
     responses={
         400: {"model": Error400, "description": "Bad Request"},
         401: {"model": Error401, "description": "Unauthorized"},
@@ -146,8 +160,8 @@ async def retrieve_ppid(
     request: RequestBody,
     token: CurrentToken,
     service: IdentifierService,
-    x_correlator: Optional[str] = Header(None, alias="x-correlator")
-) -> DevicePPID:
+    x_correlator: XCorrelatorHeader = None
+) -> Response:
     """
     Retrieve PPID.
     
@@ -170,10 +184,13 @@ async def retrieve_ppid(
         raise HTTPException(
             status_code=401,
             detail={
-                "code": "UNAUTHENTICATED",
+                "code": UNAUTHENTICATED,
                 "message": "Client ID not found in token"
             }
         )
     device = _validate_device_xor_token(request, token)
     
-    return service.retrieve_ppid(device, client_id)
+    return Response(
+        content=dump_identifier_response(await service.retrieve_ppid(device, client_id)),
+        media_type="application/json",
+    )
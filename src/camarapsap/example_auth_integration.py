@@ -5,11 +5,10 @@ This file demonstrates how to integrate the JWT authorization system
 with FastAPI endpoints using the authentication dependencies.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Header
-from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException
 
 from .config import settings
-from .dependencies import require_scope
+from .dependencies import XCorrelatorHeader, require_scope
 from .models.auth import AccessToken, Scope
 from .models.device_identifier import RequestBody, DeviceIdentifier
 from .models.error_models.camara_errors import Error401, Error403
@@ -31,7 +30,7 @@ router = APIRouter(
 )
 async def retrieve_identifier_with_auth(
     request: RequestBody,
-    x_correlator: Optional[str] = Header(None, alias="x-correlator"),
+    x_correlator: XCorrelatorHeader = None,
     # Require authentication with specific scope
     token: AccessToken = Depends(require_scope(Scope.DEVICE_IDENTIFIER_RETRIEVE_IDENTIFIER))
 ) -> DeviceIdentifier:
@@ -103,11 +102,9 @@ async def retrieve_identifier_with_auth(
 
 # Example: How to create tokens (typically done in a separate auth endpoint)
 """
-from .services.authorization import AuthorizationService
+from .dependencies import auth_service
 from .models.auth import Scope
 
-auth_service = AuthorizationService()
-
 # Create 2-legged token (client credentials flow)
 two_legged_token = auth_service.create_two_legged_token(
     client_id="my_client_id",
@@ -1,15 +1,14 @@
 """Location Retrieval API endpoints."""
 
-from fastapi import APIRouter, HTTPException, Header
-from typing import Optional
-from datetime import datetime
+from fastapi import HTTPException
 from .config import settings
+from .dependencies import RequestTime, XCorrelatorHeader
+from .routing import FlatAPIRouter
+from .services.location import placeholder_location
 from .models.location_retrieval import (
     RetrievalLocationRequest,
     Location,
-    Circle,
 )
-from .models.common import Point
 from .models.error_models.camara_errors import (
     Error400,
     Error401,
@@ -18,7 +17,7 @@ from .models.error_models.camara_errors import (
     Error422,
 )
 
-router = APIRouter(
+router = FlatAPIRouter(
     prefix=f"/location-retrieval/{settings.location_version_id}",
     tags=["Location retrieval"]
 )
@@ -36,7 +35,8 @@ router = APIRouter(
 )
 async def retrieve_location(
     request: RetrievalLocationRequest,
-    x_correlator: Optional[str] = Header(None, alias="x-correlator")
+    now: RequestTime,
+    x_correlator: XCorrelatorHeader = None
 ) -> Location:
     """
     Execute location retrieval for a user device.
@@ -53,15 +53,4 @@ async def retrieve_location(
         Location information with area (Circle or Polygon) and timestamp
     """
     # Placeholder implementation - returns a circular area
-    return Location(
-        lastLocationTime=datetime.now(),
-        area=Circle(
-            areaType="CIRCLE",
-            center=Point(
-                latitude=50.735851,
-                longitude=7.10066
-            ),
-            radius=800
-        ),
-        device=None
-    )
+    return placeholder_location(now)
@@ -1,13 +1,14 @@
 """Location Verification API endpoints."""
 
-from fastapi import APIRouter, HTTPException, Header
-from typing import Optional
-from datetime import datetime
+from fastapi import HTTPException, Response
 from .config import settings
+from .dependencies import RequestTime, XCorrelatorHeader
+from .routing import FlatAPIRouter
+from .services.location import placeholder_verification
 from .models.location_verification import (
     VerifyLocationRequest,
     VerifyLocationResponse,
-    VerificationResult,
+    dump_verify_location_response,
 )
 from .models.error_models.camara_errors import (
     Error400,
@@ -17,7 +18,7 @@ from .models.error_models.camara_errors import (
     Error422,
 )
 
-router = APIRouter(
+router = FlatAPIRouter(
     prefix=f"/location-verification/{settings.location_version_id}",
     tags=["Location verification"]
 )
@@ -25,6 +26,7 @@ router = APIRouter(
 
 @router.post(
     "/verify",
+    response_model=VerifyLocationResponse,
     responses={
         400: {"model": Error400, "description": "Bad Request"},
         401: {"model": Error401, "description": "Unauthorized"},
@@ -35,8 +37,9 @@ router = APIRouter(
 )
 async def verify_location(
     request: VerifyLocationRequest,
-    x_correlator: Optional[str] = Header(None, alias="x-correlator")
-) -> VerifyLocationResponse:
+    now: RequestTime,
+    x_correlator: XCorrelatorHeader = None
+) -> Response:
     """
     Verify the location of a device.
     
@@ -53,9 +56,7 @@ async def verify_location(
         Verification result (TRUE/FALSE/PARTIAL) with timestamp and optional match rate
     """
     # Placeholder implementation - returns TRUE verification
-    return VerifyLocationResponse(
-        verificationResult=VerificationResult.TRUE,
-        lastLocationTime=datetime.now(),
-        matchRate=None,
-        device=None
+    return Response(
+        content=dump_verify_location_response(placeholder_verification(now)),
+        media_type="application/json",
     )
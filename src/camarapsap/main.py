@@ -1,39 +1,117 @@
 """Main FastAPI application for CamaraPSAP."""
 
+import asyncio
+import hashlib
+import logging
+import os
+import ssl
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+import orjson
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, Response
+from .config import settings
 from .device_identifier import router as device_identifier_router
 from .location_retrieval import router as location_retrieval_router
 from .location_verification import router as location_verification_router
 from .oauth import router as oauth_router
+from .routing import include_flat_routers, install_route_index
+
+# Startup diagnostics go to uvicorn's logger so they show with its default config
+logger = logging.getLogger("uvicorn.error")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Build the OpenAPI schema before serving so /docs never stalls a request."""
+    # bcrypt runs via asyncio.to_thread and releases the GIL, so give the
+    # default executor room for several checks per core
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+    )
+    # Token signing is hashing-bound: record which implementation backs it.
+    # hashlib's OpenSSL constructors are named openssl_*; anything else is
+    # the slower built-in fallback without SHA extensions.
+    logger.info(
+        "JWT signing: %s, sha256 via %s (%s)",
+        settings.jwt_algorithm, hashlib.sha256.__name__, ssl.OPENSSL_VERSION,
+    )
+    if app.openapi_url:
+        app.openapi()  # FastAPI caches the result on app.openapi_schema
+    yield
+
 
 app = FastAPI(
     title="CamaraPSAP API",
     description="API for device identification, location retrieval, and location verification with OAuth 2.0 authentication",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+    # DISABLE_DOCS=true skips the docs/schema endpoints entirely (faster cold start)
+    docs_url=None if settings.disable_docs else "/docs",
+    redoc_url=None if settings.disable_docs else "/redoc",
+    openapi_url=None if settings.disable_docs else "/openapi.json",
 )
 
-# Include routers
-app.include_router(oauth_router)  # OAuth endpoints first
-app.include_router(device_identifier_router)
-app.include_router(location_retrieval_router)
-app.include_router(location_verification_router)
-
-
-@app.get("/")
-async def root() -> dict[str, str]:
-    """Root endpoint."""
-    return {
+# Constant bodies are serialised once; the same Response is safe to resend
+_HEALTH_RESPONSE = Response(
+    content=orjson.dumps({"status": "healthy"}),
+    media_type="application/json",
+)
+_ROOT_RESPONSE = Response(
+    content=orjson.dumps({
         "message": "Welcome to CamaraPSAP API",
         "version": "0.1.0",
-    }
+    }),
+    media_type="application/json",
+)
 
 
+# Probes dominate traffic; /health is a static path, answered from the route
+# index's exact-path dict with a prebuilt response
 @app.get("/health")
-async def health_check() -> dict[str, str]:
+async def health_check() -> Response:
     """Health check endpoint."""
-    return {"status": "healthy"}
+    return _HEALTH_RESPONSE
+
+
+@app.get("/")
+async def root() -> Response:
+    """Root endpoint."""
+    return _ROOT_RESPONSE
+
+
+# Include routers (routes are mounted as built, without being re-created)
+include_flat_routers(
+    app,
+    oauth_router,  # OAuth endpoints first
+    device_identifier_router,
+    location_retrieval_router,
+    location_verification_router,
+)
+
+# Dispatch through one fused regex/static-path lookup instead of a linear scan
+install_route_index(app)
+
+
+def main() -> str:
+    """Return the package greeting."""
+    return "Hello from CamaraPSAP!"
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    
+    # uvloop + httptools come with uvicorn[standard]; uvloop has no Windows build
+    uvicorn.run(
+        app,
+        host=settings.host,
+        port=settings.port,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        log_level=settings.log_level,
+        access_log=settings.access_log,
+    )
@@ -1,9 +1,14 @@
 """Models package for CamaraPSAP API."""
 
-from . import common
-from . import device_identifier
-from . import location_retrieval
-from . import location_verification
+import importlib
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import common
+    from . import device_identifier
+    from . import location_retrieval
+    from . import location_verification
 
 __all__ = [
     "common",
@@ -11,3 +16,10 @@ __all__ = [
     "location_retrieval",
     "location_verification",
 ]
+
+
+def __getattr__(name: str) -> ModuleType:
+    # Subpackages compile their pydantic schemas on import; load them on first use (PEP 562)
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f".{name}", __name__)
@@ -1,12 +1,35 @@
 """Authentication module for OAuth 2.0 and JWT token handling."""
 
-from .token import TokenType, Scope, AccessToken
-from .oauth_responses import TokenResponse, TokenRevocationResponse
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .token import TokenType, Scope, AccessToken, scopes_to_mask
+    from .oauth_responses import TokenResponse, TokenRevocationResponse
 
 __all__ = [
     "TokenType",
     "Scope",
     "AccessToken",
+    "scopes_to_mask",
     "TokenResponse",
     "TokenRevocationResponse",
 ]
+
+# Name -> defining submodule, imported on first access (PEP 562)
+_LAZY_EXPORTS = {
+    "TokenType": ".token",
+    "Scope": ".token",
+    "AccessToken": ".token",
+    "scopes_to_mask": ".token",
+    "TokenResponse": ".oauth_responses",
+    "TokenRevocationResponse": ".oauth_responses",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
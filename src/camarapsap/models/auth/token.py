@@ -1,9 +1,10 @@
 """JWT access token models."""
 
-from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+import time
+from datetime import datetime
+from typing import Optional, Dict, Any, Iterable
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from ..common.device import Device
 
 
@@ -20,6 +21,23 @@ class Scope(str, Enum):
     DEVICE_IDENTIFIER_RETRIEVE_PPID = "device-identifier:retrieve-ppid"
     LOCATION_RETRIEVAL_READ = "location-retrieval:read"
     LOCATION_VERIFICATION_VERIFY = "location-verification:verify"
+    
+    @property
+    def mask(self) -> int:
+        """Bit representing this scope in a scope bitmask."""
+        return _SCOPE_BITS[self.value]
+
+
+# Scope value -> bit, assigned in declaration order (append new scopes at the end)
+_SCOPE_BITS: Dict[str, int] = {scope.value: 1 << i for i, scope in enumerate(Scope)}
+
+
+def scopes_to_mask(scopes: Iterable[str]) -> int:
+    """Encode scope strings as a bitmask, ignoring unknown scopes."""
+    mask = 0
+    for scope in scopes:
+        mask |= _SCOPE_BITS.get(scope, 0)
+    return mask
 
 
 class AccessToken(BaseModel):
@@ -32,20 +50,39 @@ class AccessToken(BaseModel):
     client_id: str = Field(..., description="Client application ID")
     user_id: Optional[str] = Field(None, description="User ID (3-legged tokens only)")
     device_info: Optional[Device] = Field(None, description="Device information (3-legged tokens only)")
+    jti: Optional[str] = Field(None, description="Token identifier used as the revocation key")
+    
+    # Scope set built once at construction so has_scope is a hash lookup
+    _scope_set: frozenset[str] = PrivateAttr(default_factory=frozenset)
+    _scope_mask: int = PrivateAttr(default=0)
+    # Derived once: tokens are immutable after construction and reused from caches
+    _expires_at_ts: float = PrivateAttr(default=0.0)
+    _scope_str: str = PrivateAttr(default="")
+    
+    def model_post_init(self, __context: Any) -> None:
+        self._scope_set = frozenset(self.scopes)
+        self._scope_mask = scopes_to_mask(self.scopes)
+        self._expires_at_ts = self.expires_at.timestamp()
+        self._scope_str = " ".join(self.scopes)
+    
+    @property
+    def scope_mask(self) -> int:
+        """Granted scopes encoded as a bitmask (see ``Scope.mask``)."""
+        return self._scope_mask
     
     def is_expired(self) -> bool:
         """Check if token is expired."""
-        return datetime.now(timezone.utc) >= self.expires_at
+        return time.time() >= self._expires_at_ts
     
     def has_scope(self, scope: str) -> bool:
         """Check if token has required scope."""
-        return scope in self.scopes
+        return scope in self._scope_set
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert token to dictionary format for API response."""
         return {
             "access_token": self.token,
             "token_type": "Bearer",
-            "expires_in": int((self.expires_at - datetime.now(timezone.utc)).total_seconds()),
-            "scope": " ".join(self.scopes),
+            "expires_in": int(self._expires_at_ts - time.time()),
+            "scope": self._scope_str,
         }
@@ -1,18 +1,22 @@
 """Common models shared across APIs."""
 
-from .device import Device, DeviceResponse
-from .device_ipv4 import DeviceIpv4Addr
-from .device_ipv6 import DeviceIpv6Address
-from .phone_number import PhoneNumber
-from .network_access_identifier import NetworkAccessIdentifier
-from .point import Point
-from .point_list import PointList
-from .coordinates import Latitude, Longitude
-from .single_ipv4 import SingleIpv4Addr
-from .port import Port
-from .time_period import TimePeriod
-from .error import ErrorInfo
-from .x_correlator import XCorrelator
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .device import Device, DeviceResponse
+    from .device_ipv4 import DeviceIpv4Addr
+    from .device_ipv6 import DeviceIpv6Address
+    from .phone_number import PhoneNumber
+    from .network_access_identifier import NetworkAccessIdentifier
+    from .point import Point
+    from .point_list import PointList
+    from .coordinates import Latitude, Longitude
+    from .single_ipv4 import SingleIpv4Addr
+    from .port import Port
+    from .time_period import TimePeriod
+    from .error import ErrorInfo
+    from .x_correlator import XCorrelator
 
 __all__ = [
     "Device",
@@ -31,3 +35,30 @@ __all__ = [
     "ErrorInfo",
     "XCorrelator",
 ]
+
+# Model name -> defining submodule, imported on first access (PEP 562)
+_LAZY_MODELS = {
+    "Device": ".device",
+    "DeviceResponse": ".device",
+    "DeviceIpv4Addr": ".device_ipv4",
+    "DeviceIpv6Address": ".device_ipv6",
+    "PhoneNumber": ".phone_number",
+    "NetworkAccessIdentifier": ".network_access_identifier",
+    "Point": ".point",
+    "PointList": ".point_list",
+    "Latitude": ".coordinates",
+    "Longitude": ".coordinates",
+    "SingleIpv4Addr": ".single_ipv4",
+    "Port": ".port",
+    "TimePeriod": ".time_period",
+    "ErrorInfo": ".error",
+    "XCorrelator": ".x_correlator",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_MODELS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_MODELS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,35 @@
+"""IP address checks shared by the address models."""
+
+from functools import lru_cache
+import socket
+
+
+@lru_cache(maxsize=4096)
+def is_ipv4(address: str) -> bool:
+    """Check an IPv4 address with the C ``inet_pton`` parser (memoized).
+    
+    Devices recur across requests (NAT pools, paging bursts), so repeat
+    addresses are answered from the cache.
+    """
+    try:
+        socket.inet_pton(socket.AF_INET, address)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+@lru_cache(maxsize=4096)
+def is_ipv6(address: str) -> bool:
+    """Check an IPv6 address with ``inet_pton`` (memoized).
+    
+    ``inet_pton`` has no notion of zones, so a scope id (``fe80::1%eth0``) is
+    split off and checked the way ``ipaddress.IPv6Address`` does.
+    """
+    address, sep, scope_id = address.partition("%")
+    if sep and (not scope_id or "%" in scope_id or "/" in scope_id):
+        return False
+    try:
+        socket.inet_pton(socket.AF_INET6, address)
+    except (OSError, ValueError):
+        return False
+    return True
@@ -1,11 +1,13 @@
 """Latitude and Longitude coordinate models."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
 
 class Latitude(BaseModel):
     """Latitude component of a location."""
     
+    model_config = ConfigDict(frozen=True)
+    
     value: float = Field(
         ...,
         ge=-90,
@@ -17,6 +19,8 @@ class Latitude(BaseModel):
 class Longitude(BaseModel):
     """Longitude component of location."""
     
+    model_config = ConfigDict(frozen=True)
+    
     value: float = Field(
         ...,
         ge=-180,
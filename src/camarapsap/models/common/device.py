@@ -2,7 +2,7 @@
 
 from pydantic import BaseModel, Field, model_validator, ConfigDict
 from typing import Optional
-from .phone_number import PhoneNumber
+from .phone_number import PhoneNumber, E164Str
 from .network_access_identifier import NetworkAccessIdentifier
 from .device_ipv4 import DeviceIpv4Addr
 from .device_ipv6 import DeviceIpv6Address
@@ -28,12 +28,11 @@ class Device(BaseModel):
     CAMARA does not currently allow its use.
     """
     
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
     
-    phone_number: Optional[str] = Field(
+    phone_number: Optional[E164Str] = Field(
         None,
         alias="phoneNumber",
-        pattern=r'^\+[1-9][0-9]{4,14}$',
         examples=["+123456789"],
         description="Phone number in E.164 format"
     )
@@ -57,12 +56,13 @@ class Device(BaseModel):
     
     @model_validator(mode='after')
     def check_at_least_one_identifier(self) -> 'Device':
-        if not any([
-            self.phone_number,
-            self.network_access_identifier,
-            self.ipv4_address,
-            self.ipv6_address
-        ]):
+        mask = (
+            bool(self.phone_number)
+            | (bool(self.network_access_identifier) << 1)
+            | (bool(self.ipv4_address) << 2)
+            | (bool(self.ipv6_address) << 3)
+        )
+        if mask == 0:
             raise ValueError('At least one device identifier must be provided')
         return self
 
@@ -79,12 +79,12 @@ class DeviceResponse(Device):
     
     @model_validator(mode='after')
     def check_max_one_identifier(self) -> 'DeviceResponse':
-        identifiers = sum([
-            self.phone_number is not None,
-            self.network_access_identifier is not None,
-            self.ipv4_address is not None,
-            self.ipv6_address is not None
-        ])
-        if identifiers > 1:
+        mask = (
+            (self.phone_number is not None)
+            | ((self.network_access_identifier is not None) << 1)
+            | ((self.ipv4_address is not None) << 2)
+            | ((self.ipv6_address is not None) << 3)
+        )
+        if mask & (mask - 1):  # more than one bit set
             raise ValueError('DeviceResponse must contain at most one identifier')
         return self
@@ -2,7 +2,7 @@
 
 from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
 from typing import Optional
-import ipaddress
+from ._ip import is_ipv4
 
 
 class DeviceIpv4Addr(BaseModel):
@@ -21,7 +21,7 @@ class DeviceIpv4Addr(BaseModel):
     devices cannot be identified by their public IPv4 address alone.
     """
     
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
     
     public_address: str = Field(
         ...,
@@ -47,11 +47,8 @@ class DeviceIpv4Addr(BaseModel):
     @field_validator('public_address', 'private_address')
     @classmethod
     def validate_ipv4(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None:
-            try:
-                ipaddress.IPv4Address(v)
-            except ValueError:
-                raise ValueError(f'Invalid IPv4 address: {v}')
+        if v is not None and not is_ipv4(v):
+            raise ValueError(f'Invalid IPv4 address: {v}')
         return v
     
     @model_validator(mode='after')
@@ -1,7 +1,7 @@
 """Device IPv6 address model."""
 
 from pydantic import BaseModel, Field, field_validator
-import ipaddress
+from ._ip import is_ipv6
 
 
 class DeviceIpv6Address(BaseModel):
@@ -19,8 +19,6 @@ class DeviceIpv6Address(BaseModel):
     @field_validator('ipv6_address')
     @classmethod
     def validate_ipv6(cls, v: str) -> str:
-        try:
-            ipaddress.IPv6Address(v)
-        except ValueError:
+        if not is_ipv6(v):
             raise ValueError(f'Invalid IPv6 address: {v}')
         return v
@@ -1,7 +1,11 @@
 """Phone number model."""
 
-from pydantic import BaseModel, Field, field_validator
-import re
+from typing import Annotated
+from pydantic import BaseModel, Field, StringConstraints
+
+# E.164 number prefixed with '+'; one shared type so every field reuses one validator
+E164_PATTERN = r'^\+[1-9][0-9]{4,14}$'
+E164Str = Annotated[str, StringConstraints(pattern=E164_PATTERN)]
 
 
 class PhoneNumber(BaseModel):
@@ -12,16 +16,8 @@ class PhoneNumber(BaseModel):
     formatted in international format, according to E.164 standard, prefixed with '+'.
     """
     
-    phone_number: str = Field(
+    phone_number: E164Str = Field(
         ...,
-        pattern=r'^\+[1-9][0-9]{4,14}$',
         examples=["+123456789"],
         description="Phone number in E.164 format"
     )
-    
-    @field_validator('phone_number')
-    @classmethod
-    def validate_phone_number(cls, v: str) -> str:
-        if not re.match(r'^\+[1-9][0-9]{4,14}$', v):
-            raise ValueError('Phone number must be in E.164 format with + prefix')
-        return v
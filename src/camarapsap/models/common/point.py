@@ -7,6 +7,7 @@ class Point(BaseModel):
     """Coordinates (latitude, longitude) defining a location in a map."""
     
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "example": {
                 "latitude": 50.735851,
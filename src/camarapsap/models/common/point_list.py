@@ -1,6 +1,6 @@
 """Point list model for polygons."""
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
 from typing import List
 from .point import Point
 
@@ -14,12 +14,3 @@ class PointList(BaseModel):
         max_length=15,
         description="List of points defining a polygon"
     )
-    
-    @field_validator('points')
-    @classmethod
-    def validate_point_list(cls, v: List[Point]) -> List[Point]:
-        if len(v) < 3:
-            raise ValueError('Polygon must have at least 3 points')
-        if len(v) > 15:
-            raise ValueError('Polygon must have at most 15 points')
-        return v
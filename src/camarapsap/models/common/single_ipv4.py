@@ -1,7 +1,7 @@
 """Single IPv4 address model."""
 
 from pydantic import BaseModel, Field, field_validator
-import ipaddress
+from ._ip import is_ipv4
 
 
 class SingleIpv4Addr(BaseModel):
@@ -16,8 +16,6 @@ class SingleIpv4Addr(BaseModel):
     @field_validator('address')
     @classmethod
     def validate_ipv4(cls, v: str) -> str:
-        try:
-            ipaddress.IPv4Address(v)
-        except ValueError:
+        if not is_ipv4(v):
             raise ValueError(f'Invalid IPv4 address: {v}')
         return v
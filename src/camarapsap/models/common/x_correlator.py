@@ -2,13 +2,16 @@
 
 from pydantic import BaseModel, Field
 
+# Compiled by pydantic-core wherever it is used (models and header parameters)
+X_CORRELATOR_PATTERN = r'^[a-zA-Z0-9-_:;.\/<>{}]{0,256}$'
+
 
 class XCorrelator(BaseModel):
     """Correlation id for the different services."""
     
     x_correlator: str = Field(
         ...,
-        pattern=r'^[a-zA-Z0-9-_:;.\/<>{}]{0,256}$',
+        pattern=X_CORRELATOR_PATTERN,
         examples=["b4333c46-49c0-4f62-80d7-f0ef930f1c46"],
         description="Correlation id for the different services"
     )
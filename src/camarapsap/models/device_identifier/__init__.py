@@ -6,6 +6,7 @@ from .models import (
     DeviceIdentifier,
     DeviceType,
     DevicePPID,
+    dump_identifier_response,
 )
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     "DeviceIdentifier",
     "DeviceType",
     "DevicePPID",
+    "dump_identifier_response",
 ]
@@ -1,10 +1,15 @@
 """Device Identifier models."""
 
-from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional
+from pydantic import BaseModel, Field, ConfigDict, StringConstraints, TypeAdapter
+from typing import Annotated, Optional
 from datetime import datetime
 from ..common.device import Device, DeviceResponse
 
+# Equipment identifier formats, shared by every response model that carries them
+ImeiStr = Annotated[str, StringConstraints(pattern=r'^\d{15}$')]
+ImeisvStr = Annotated[str, StringConstraints(pattern=r'^\d{16}$')]
+TacStr = Annotated[str, StringConstraints(pattern=r'^\d{8}$')]
+
 
 class RequestBody(BaseModel):
     """Common request body to allow optional Device object to be passed."""
@@ -34,19 +39,16 @@ class CommonResponseBody(BaseModel):
 class DeviceIdentifier(CommonResponseBody):
     """The individual physical mobile device identifier, as expressed by the IMEI and IMEISV."""
     
-    imei: str = Field(
+    imei: ImeiStr = Field(
         ...,
-        pattern=r'^\d{15}$',
         description="International Mobile Equipment Identity (15 digits)"
     )
-    imeisv: Optional[str] = Field(
+    imeisv: Optional[ImeisvStr] = Field(
         None,
-        pattern=r'^\d{16}$',
         description="IMEI with Software Version (16 digits)"
     )
-    tac: Optional[str] = Field(
+    tac: Optional[TacStr] = Field(
         None,
-        pattern=r'^\d{8}$',
         description="Type Allocation Code (first 8 digits of IMEI)"
     )
     manufacturer: Optional[str] = Field(
@@ -62,9 +64,8 @@ class DeviceIdentifier(CommonResponseBody):
 class DeviceType(CommonResponseBody):
     """The physical device type, as expressed by Type Approval Code, manufacturer name and model name."""
     
-    tac: str = Field(
+    tac: TacStr = Field(
         ...,
-        pattern=r'^\d{8}$',
         description="Type Allocation Code (first 8 digits of IMEI)"
     )
     manufacturer: Optional[str] = Field(
@@ -84,3 +85,14 @@ class DevicePPID(CommonResponseBody):
         ...,
         description="Pairwise Pseudonymous Identifier - unique to but persistent for a given API consumer"
     )
+
+
+# Serializers specialised per response model once, at import
+_RESPONSE_ADAPTERS: dict[type[CommonResponseBody], TypeAdapter] = {
+    model: TypeAdapter(model) for model in (DeviceIdentifier, DeviceType, DevicePPID)
+}
+
+
+def dump_identifier_response(response: CommonResponseBody) -> bytes:
+    """Serialize a device identifier API response straight to JSON bytes (by alias)."""
+    return _RESPONSE_ADAPTERS[type(response)].dump_json(response, by_alias=True)
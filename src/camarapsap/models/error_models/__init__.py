@@ -9,6 +9,22 @@ from .camara_errors import (
     ErrorCode429,
     ErrorCode500,
     ErrorCode503,
+    INVALID_ARGUMENT,
+    OUT_OF_RANGE,
+    UNAUTHENTICATED,
+    PERMISSION_DENIED,
+    INVALID_TOKEN_CONTEXT,
+    NOT_FOUND,
+    IDENTIFIER_NOT_FOUND,
+    SERVICE_NOT_APPLICABLE,
+    MISSING_IDENTIFIER,
+    UNSUPPORTED_IDENTIFIER,
+    UNNECESSARY_IDENTIFIER,
+    QUOTA_EXCEEDED,
+    TOO_MANY_REQUESTS,
+    INTERNAL,
+    UNAVAILABLE,
+    CamaraError,
     Error400,
     Error401,
     Error403,
@@ -28,6 +44,22 @@ __all__ = [
     "ErrorCode429",
     "ErrorCode500",
     "ErrorCode503",
+    "INVALID_ARGUMENT",
+    "OUT_OF_RANGE",
+    "UNAUTHENTICATED",
+    "PERMISSION_DENIED",
+    "INVALID_TOKEN_CONTEXT",
+    "NOT_FOUND",
+    "IDENTIFIER_NOT_FOUND",
+    "SERVICE_NOT_APPLICABLE",
+    "MISSING_IDENTIFIER",
+    "UNSUPPORTED_IDENTIFIER",
+    "UNNECESSARY_IDENTIFIER",
+    "QUOTA_EXCEEDED",
+    "TOO_MANY_REQUESTS",
+    "INTERNAL",
+    "UNAVAILABLE",
+    "CamaraError",
     "Error400",
     "Error401",
     "Error403",
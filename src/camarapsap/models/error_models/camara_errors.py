@@ -100,66 +100,70 @@ class ErrorCode504(str, Enum):
     TIMEOUT = "TIMEOUT"
 
 
-# Specific error response models - standalone without inheritance
-class Error400(BaseModel):
-    """400 Bad Request error."""
+# Plain-string codes bound once at import, so error details built on hot paths
+# skip the Enum member lookup
+INVALID_ARGUMENT: str = ErrorCode400.INVALID_ARGUMENT.value
+OUT_OF_RANGE: str = ErrorCode400.OUT_OF_RANGE.value
+UNAUTHENTICATED: str = ErrorCode401.UNAUTHENTICATED.value
+PERMISSION_DENIED: str = ErrorCode403.PERMISSION_DENIED.value
+INVALID_TOKEN_CONTEXT: str = ErrorCode403.INVALID_TOKEN_CONTEXT.value
+NOT_FOUND: str = ErrorCode404.NOT_FOUND.value
+IDENTIFIER_NOT_FOUND: str = ErrorCode404.IDENTIFIER_NOT_FOUND.value
+SERVICE_NOT_APPLICABLE: str = ErrorCode422.SERVICE_NOT_APPLICABLE.value
+MISSING_IDENTIFIER: str = ErrorCode422.MISSING_IDENTIFIER.value
+UNSUPPORTED_IDENTIFIER: str = ErrorCode422.UNSUPPORTED_IDENTIFIER.value
+UNNECESSARY_IDENTIFIER: str = ErrorCode422.UNNECESSARY_IDENTIFIER.value
+QUOTA_EXCEEDED: str = ErrorCode429.QUOTA_EXCEEDED.value
+TOO_MANY_REQUESTS: str = ErrorCode429.TOO_MANY_REQUESTS.value
+INTERNAL: str = ErrorCode500.INTERNAL.value
+UNAVAILABLE: str = ErrorCode503.UNAVAILABLE.value
+
+
+class CamaraError(BaseModel):
+    """Common CAMARA error response body."""
     model_config = ConfigDict(use_enum_values=True)
-    status: Literal[400] = 400
+    status: int = Field(..., description="HTTP response status code")
     code: str = Field(..., description="Error code")
     message: str = Field(..., description="Error message")
 
 
-class Error401(BaseModel):
+# Status-specific variants narrow ``status`` so the OpenAPI document keeps
+# one schema per status code; fields and config are shared via CamaraError
+class Error400(CamaraError):
+    """400 Bad Request error."""
+    status: Literal[400] = 400
+
+
+class Error401(CamaraError):
     """401 Unauthorized error."""
-    model_config = ConfigDict(use_enum_values=True)
     status: Literal[401] = 401
-    code: str = Field(..., description="Error code")
-    message: str = Field(..., description="Error message")
 
 
-class Error403(BaseModel):
+class Error403(CamaraError):
     """403 Forbidden error."""
-    model_config = ConfigDict(use_enum_values=True)
     status: Literal[403] = 403
-    code: str = Field(..., description="Error code")
-    message: str = Field(..., description="Error message")
 
 
-class Error404(BaseModel):
+class Error404(CamaraError):
     """404 Not Found error."""
-    model_config = ConfigDict(use_enum_values=True)
     status: Literal[404] = 404
-    code: str = Field(..., description="Error code")
-    message: str = Field(..., description="Error message")
 
 
-class Error422(BaseModel):
+class Error422(CamaraError):
     """422 Unprocessable Entity error."""
-    model_config = ConfigDict(use_enum_values=True)
     status: Literal[422] = 422
-    code: str = Field(..., description="Error code")
-    message: str = Field(..., description="Error message")
 
 
-class Error429(BaseModel):
+class Error429(CamaraError):
     """429 Too Many Requests error."""
-    model_config = ConfigDict(use_enum_values=True)
     status: Literal[429] = 429
-    code: str = Field(..., description="Error code")
-    message: str = Field(..., description="Error message")
 
 
-class Error500(BaseModel):
+class Error500(CamaraError):
     """500 Internal Server Error."""
-    model_config = ConfigDict(use_enum_values=True)
     status: Literal[500] = 500
-    code: str = Field(..., description="Error code")
-    message: str = Field(..., description="Error message")
 
 
-class Error503(BaseModel):
+class Error503(CamaraError):
     """503 Service Unavailable error."""
-    model_config = ConfigDict(use_enum_values=True)
     status: Literal[503] = 503
-    code: str = Field(..., description="Error code")
-    message: str = Field(..., description="Error message")
@@ -1,7 +1,7 @@
 """Location Retrieval models."""
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict, model_validator
-from typing import Optional, List, Literal, Union, Annotated
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
+from typing import Any, Optional, List, Literal, Union, Annotated
 from datetime import datetime
 from enum import Enum
 from ..common.device import Device, DeviceResponse
@@ -19,6 +19,7 @@ class Circle(BaseModel):
     """Circular area."""
     
     model_config = ConfigDict(
+        frozen=True,
         populate_by_name=True,
         json_schema_extra={
             "example": {
@@ -51,7 +52,7 @@ class Circle(BaseModel):
 class Polygon(BaseModel):
     """Polygonal area."""
     
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
     
     area_type: Literal["POLYGON"] = Field(
         "POLYGON",
@@ -65,18 +66,43 @@ class Polygon(BaseModel):
         description="List of points defining the polygon boundary"
     )
     
-    @field_validator('boundary')
-    @classmethod
-    def validate_polygon_closed(cls, v: List[Point]) -> List[Point]:
-        if len(v) < 3:
-            raise ValueError('Polygon must have at least 3 points')
-        if len(v) > 15:
-            raise ValueError('Polygon must have at most 15 points')
-        return v
+    # Vertex coordinates as parallel arrays for geometry code; boundary is
+    # kept for (de)serialization only
+    _lats: tuple[float, ...] = PrivateAttr(default=())
+    _lons: tuple[float, ...] = PrivateAttr(default=())
+    
+    def model_post_init(self, __context: Any) -> None:
+        self._lats = tuple(p.latitude for p in self.boundary)
+        self._lons = tuple(p.longitude for p in self.boundary)
+    
+    def contains(self, point: Point) -> bool:
+        """Check whether a point lies inside the polygon.
+        
+        Uses the PNPoly even-odd crossing test on raw latitude/longitude, which
+        is accurate for the city-scale areas CAMARA polygons describe.
+        
+        Args:
+            point: The point to test
+        
+        Returns:
+            True if the point is inside the boundary, False otherwise
+        """
+        lat, lon = point.latitude, point.longitude
+        lats, lons = self._lats, self._lons
+        inside = False
+        lat_j, lon_j = lats[-1], lons[-1]
+        for lat_i, lon_i in zip(lats, lons):
+            if (lat_i > lat) != (lat_j > lat) and lon < (
+                (lon_j - lon_i) * (lat - lat_i) / (lat_j - lat_i) + lon_i
+            ):
+                inside = not inside
+            lat_j, lon_j = lat_i, lon_i
+        return inside
 
 
-# Union type for Area (no base class needed)
-Area = Union[Circle, Polygon]
+# Tagged union for Area: pydantic-core dispatches on areaType in one step
+# instead of trying each member in turn
+Area = Annotated[Union[Circle, Polygon], Field(discriminator="area_type")]
 
 
 class RetrievalLocationRequest(BaseModel):
@@ -86,7 +112,7 @@ class RetrievalLocationRequest(BaseModel):
     in the description.
     """
     
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
     
     device: Optional[Device] = Field(
         None,
@@ -111,6 +137,7 @@ class Location(BaseModel):
     """Device location."""
     
     model_config = ConfigDict(
+        frozen=True,
         populate_by_name=True,
         json_schema_extra={
             "example": {
@@ -132,7 +159,7 @@ class Location(BaseModel):
         alias="lastLocationTime",
         description="Last date and time when the device was localized"
     )
-    area: Annotated[Union[Circle, Polygon], Field(discriminator="area_type")] = Field(
+    area: Area = Field(
         ...,
         description="Area where the device is located (Circle or Polygon)"
     )
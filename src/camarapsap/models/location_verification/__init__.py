@@ -4,10 +4,12 @@ from .models import (
     VerificationResult,
     VerifyLocationRequest,
     VerifyLocationResponse,
+    dump_verify_location_response,
 )
 
 __all__ = [
     "VerificationResult",
     "VerifyLocationRequest",
     "VerifyLocationResponse",
+    "dump_verify_location_response",
 ]
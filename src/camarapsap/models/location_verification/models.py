@@ -1,6 +1,6 @@
 """Location Verification models."""
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 from typing import Optional
 from datetime import datetime
 from enum import Enum
@@ -28,7 +28,7 @@ class VerifyLocationRequest(BaseModel):
     in the description.
     """
     
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
     
     device: Optional[Device] = Field(
         None,
@@ -50,7 +50,7 @@ class VerifyLocationRequest(BaseModel):
 class VerifyLocationResponse(BaseModel):
     """Response to a location verification request."""
     
-    model_config = ConfigDict(populate_by_name=True, use_enum_values=True)
+    model_config = ConfigDict(frozen=True, populate_by_name=True, use_enum_values=True)
     
     verification_result: VerificationResult = Field(
         ...,
@@ -73,3 +73,12 @@ class VerifyLocationResponse(BaseModel):
         None,
         description="Device identifier used by the implementation (for 2-legged tokens)"
     )
+
+
+# Serializer specialised for VerifyLocationResponse once, at import
+_VERIFY_LOCATION_RESPONSE_ADAPTER = TypeAdapter(VerifyLocationResponse)
+
+
+def dump_verify_location_response(response: VerifyLocationResponse) -> bytes:
+    """Serialize a verification response straight to JSON bytes (by alias)."""
+    return _VERIFY_LOCATION_RESPONSE_ADAPTER.dump_json(response, by_alias=True)
@@ -1,22 +1,68 @@
 """OAuth 2.0 token endpoint for issuing access tokens."""
 
-from fastapi import APIRouter, HTTPException, Form, status, Depends
+from typing import Awaitable, Callable, Optional
+
+from fastapi import HTTPException, Form, Response, status, Depends
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .services.authorization import AuthorizationService
+from .dependencies import auth_service
 from .services.client import ClientService
 from .models.error_models.camara_errors import Error400, Error401
 from .models.auth import Scope, TokenResponse, TokenRevocationResponse
 from .db.database import get_db
+from .routing import FlatAPIRouter
 
 
-router = APIRouter(
+router = FlatAPIRouter(
     prefix="/oauth",
     tags=["OAuth 2.0 Authentication"]
 )
 
-# Shared authorization service instance
-auth_service = AuthorizationService()
+# Every scope value a client may request
+_VALID_SCOPES: frozenset[str] = frozenset(s.value for s in Scope)
+
+# The revocation reply never varies; build its body once
+_REVOCATION_BODY = TokenRevocationResponse().model_dump()
+
+
+async def _handle_client_credentials(
+    client_id: str, scopes: list[str], code: Optional[str]
+) -> Response:
+    """Issue a 2-legged token for the client_credentials grant."""
+    try:
+        access_token = await auth_service.create_two_legged_token(
+            client_id=client_id,
+            scopes=scopes
+        )
+        # to_dict already has the RFC 6749 wire shape; response_model only documents it
+        return ORJSONResponse(content=access_token.to_dict())
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create token: {str(e)}"
+        )
+
+
+async def _handle_authorization_code(
+    client_id: str, scopes: list[str], code: Optional[str]
+) -> Response:
+    """Handle the authorization_code grant (3-legged flow)."""
+    # 3-legged OAuth flow not yet implemented
+    raise HTTPException(
+        status_code=status.HTTP_501_NOT_IMPLEMENTED,
+        detail={
+            "code": "NOT_IMPLEMENTED",
+            "message": "Authorization code flow (3-legged authentication) is not yet implemented. Please use client_credentials grant type."
+        }
+    )
+
+
+# Supported grant types and the handler issuing each one's token
+_GRANT_HANDLERS: dict[str, Callable[[str, list[str], Optional[str]], Awaitable[Response]]] = {
+    "client_credentials": _handle_client_credentials,
+    "authorization_code": _handle_authorization_code,
+}
 
 
 @router.post(
@@ -34,7 +80,7 @@ async def token_endpoint(
     scope: str = Form(None),
     code: str = Form(None),  # For authorization_code flow
     db: AsyncSession = Depends(get_db)
-) -> TokenResponse:
+) -> Response:
     """
     OAuth 2.0 token endpoint for obtaining access tokens.
     
@@ -90,18 +136,18 @@ async def token_endpoint(
     """
     
     # Validate grant_type
-    if grant_type not in ["client_credentials", "authorization_code"]:
+    grant_handler = _GRANT_HANDLERS.get(grant_type)
+    if grant_handler is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Unsupported grant_type: {grant_type}. Must be 'client_credentials' or 'authorization_code'"
         )
     
-    # Parse requested scopes
-    scopes = scope.split() if scope else []
-    
-    # Validate scopes format
-    valid_scopes = [s.value for s in Scope]
-    invalid_scopes = [s for s in scopes if s not in valid_scopes]
+    # Parse and validate requested scopes in one pass
+    scopes: list[str] = []
+    invalid_scopes: list[str] = []
+    for s in (scope or "").split():
+        (scopes if s in _VALID_SCOPES else invalid_scopes).append(s)
     if invalid_scopes:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -125,37 +171,7 @@ async def token_endpoint(
             detail=f"Client not authorized for requested scopes. Allowed scopes: {', '.join(client.allowed_scopes)}"
         )
     
-    # Handle client_credentials flow (2-legged)
-    if grant_type == "client_credentials":
-        try:
-            access_token = await auth_service.create_two_legged_token(
-                client_id=client_id,
-                scopes=scopes
-            )
-            token_dict = access_token.to_dict()
-            return TokenResponse(**token_dict)
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to create token: {str(e)}"
-            )
-    
-    # Handle authorization_code flow (3-legged)
-    elif grant_type == "authorization_code":
-        # 3-legged OAuth flow not yet implemented
-        raise HTTPException(
-            status_code=status.HTTP_501_NOT_IMPLEMENTED,
-            detail={
-                "code": "NOT_IMPLEMENTED",
-                "message": "Authorization code flow (3-legged authentication) is not yet implemented. Please use client_credentials grant type."
-            }
-        )
-    
-    # Should never reach here, but satisfies return type checker
-    raise HTTPException(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        detail="Invalid grant_type"
-    )
+    return await grant_handler(client_id, scopes, code)
 
 
 @router.post(
@@ -171,7 +187,7 @@ async def revoke_token_endpoint(
     client_id: str = Form(...),
     client_secret: str = Form(...),
     db: AsyncSession = Depends(get_db)
-) -> TokenRevocationResponse:
+) -> ORJSONResponse:
     """
     Revoke an access token.
     
@@ -202,11 +218,11 @@ async def revoke_token_endpoint(
         )
     
     # Revoke the token
-    success = await auth_service.revoke_token(token)
+    revoked = await auth_service.revoke_token(token)
     
-    if not success:
+    if not revoked:
         # Per OAuth 2.0 spec, revocation endpoint should succeed even if token is invalid
         # This prevents token scanning attacks
         pass
     
-    return TokenRevocationResponse()
+    return ORJSONResponse(_REVOCATION_BODY)
@@ -0,0 +1,176 @@
+"""Routing helpers for assembling the FastAPI application."""
+
+import re
+from typing import Any, Optional
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import ORJSONResponse
+from starlette.routing import Match, Route, Router
+from starlette.types import Receive, Scope, Send
+
+# Starlette compiles "{param}" to a named group; names repeat across routes
+_NAMED_GROUP = re.compile(r"\(\?P<\w+>")
+
+
+class _DependencyOverrides:
+    """Dependency-override provider for routers created before the app.
+    
+    Reads through to the app bound by ``include_flat_routers``, so overrides
+    set on ``app.dependency_overrides``, or a dict assigned to it later, reach
+    the pre-built routes.
+    """
+    
+    def __init__(self) -> None:
+        self._app: Optional[FastAPI] = None
+    
+    def bind(self, app: FastAPI) -> None:
+        self._app = app
+    
+    @property
+    def dependency_overrides(self) -> dict[Any, Any]:
+        return self._app.dependency_overrides if self._app is not None else {}
+
+
+# Routes capture their overrides provider when built; this one is handed to the app
+dependency_overrides_provider = _DependencyOverrides()
+
+
+class FlatAPIRouter(APIRouter):
+    """APIRouter whose routes are mounted on the app without being rebuilt.
+    
+    ``FastAPI.include_router`` re-creates every APIRoute on the parent router,
+    re-running dependency analysis and response-model setup for each one. Routes
+    on a FlatAPIRouter are already complete (prefix, tags, responses applied), so
+    ``include_flat_routers`` attaches them to the app as-is. App-level defaults
+    are therefore not inherited, so the JSON response class is set here too.
+    """
+    
+    def __init__(self, **kwargs: Any) -> None:
+        kwargs.setdefault("dependency_overrides_provider", dependency_overrides_provider)
+        kwargs.setdefault("default_response_class", ORJSONResponse)
+        super().__init__(**kwargs)
+
+
+def include_flat_routers(app: FastAPI, *routers: APIRouter) -> None:
+    """Attach the routes of already-built routers directly to the app.
+    
+    Args:
+        app: The FastAPI application
+        routers: Routers whose routes should be served by the app, in order
+    """
+    # Overrides set on the app (e.g. in tests) must reach the pre-built routes
+    dependency_overrides_provider.bind(app)
+    for router in routers:
+        app.router.routes.extend(router.routes)
+
+
+def _route_path(scope: Scope) -> str:
+    """Request path relative to the app's ``root_path``, as Starlette matches it."""
+    path: str = scope["path"]
+    root_path: str = scope.get("root_path", "")
+    if not root_path or not path.startswith(root_path):
+        return path
+    if path == root_path:
+        return ""
+    if path[len(root_path)] == "/":
+        return path[len(root_path):]
+    return path
+
+
+class RouteIndex:
+    """ASGI dispatcher that finds a router's HTTP route without a linear scan.
+    
+    Starlette's ``Router`` calls ``matches()`` on every route in order until one
+    fits. RouteIndex groups routes by their path regex and folds every distinct
+    regex into one alternation, ordered by first registration, so a single
+    ``re.match`` yields the earliest routes that can match the path; exact static
+    paths are memoised in a dict. A full match is handled directly, anything else
+    (405s, slash redirects, 404s, websockets) goes through the router's own scan
+    so behaviour is unchanged.
+    """
+    
+    def __init__(self, router: Router) -> None:
+        self.router = router
+        self._fallback = router.app
+        self._indexed_count = -1
+        self._pattern: Optional[re.Pattern[str]] = None
+        # Per regex: (route, no route with another regex registered in between)
+        self._groups: dict[str, tuple[tuple[Route, bool], ...]] = {}
+        self._static: dict[str, tuple[tuple[Route, bool], ...]] = {}
+    
+    def _rebuild(self) -> None:
+        routes = self.router.routes
+        self._indexed_count = len(routes)
+        self._pattern = None
+        self._groups = {}
+        self._static = {}
+        
+        indexed: list[Route] = []
+        by_regex: dict[str, list[tuple[Route, bool]]] = {}
+        previous = None
+        for route in routes:
+            if not isinstance(route, Route):
+                # Mounts, hosts and websockets keep Starlette's own matching
+                return
+            indexed.append(route)
+            regex = route.path_regex.pattern
+            group = by_regex.setdefault(regex, [])
+            contiguous = not group or (previous == regex and group[-1][1])
+            group.append((route, contiguous))
+            previous = regex
+        if not by_regex:
+            return
+        
+        alternatives = []
+        for i, (regex, group) in enumerate(by_regex.items()):
+            name = f"r{i}"
+            self._groups[name] = tuple(group)
+            body = _NAMED_GROUP.sub("(?:", regex.removeprefix("^").removesuffix("$"))
+            alternatives.append(f"(?P<{name}>{body})")
+        pattern = self._pattern = re.compile("^(?:" + "|".join(alternatives) + ")$")
+        
+        for route in indexed:
+            if not route.param_convertors:
+                self._static[route.path] = self._lookup(pattern, route.path)
+    
+    def _lookup(self, pattern: re.Pattern[str], path: str) -> tuple[tuple[Route, bool], ...]:
+        match = pattern.match(path)
+        # Every alternative is a named group, so a match always sets lastgroup
+        if match is None or match.lastgroup is None:
+            return ()
+        return self._groups[match.lastgroup]
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            if len(self.router.routes) != self._indexed_count:
+                self._rebuild()
+            if self._pattern is not None:
+                path = _route_path(scope)
+                candidates = self._static.get(path)
+                if candidates is None:
+                    candidates = self._lookup(self._pattern, path)
+                # Routes sharing a regex differ only by method. Once a route
+                # registered under another regex sits in between, that route
+                # might have matched first, so leave the decision to Starlette.
+                for route, contiguous in candidates:
+                    if not contiguous:
+                        break
+                    match, child_scope = route.matches(scope)
+                    if match == Match.FULL:
+                        scope.setdefault("router", self.router)
+                        scope["route"] = route
+                        scope.update(child_scope)
+                        await route.handle(scope, receive, send)
+                        return
+        await self._fallback(scope, receive, send)
+
+
+def install_route_index(app: FastAPI) -> None:
+    """Serve the app's routes through a RouteIndex instead of a linear scan.
+    
+    Args:
+        app: The FastAPI application; routes added later are picked up lazily
+    """
+    router = app.router
+    # Router-level middleware wraps router.app; leave such stacks alone
+    if router.middleware_stack == router.app:
+        router.middleware_stack = RouteIndex(router)
@@ -1,40 +1,152 @@
 """Authorization service for generating and validating JWT access tokens."""
 
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, Callable
+import base64
+import hashlib
+import hmac
+import secrets
+import time
 import jwt
+import orjson
 from redis import asyncio as aioredis
+from redis.exceptions import RedisError
 from ..config import settings
 from ..models.auth.token import TokenType, AccessToken
 from ..models.common.device import Device
+from .redis_client import redis_client as shared_redis_client
+from .revocation import REVOKED_PREFIX, RevokedTokenSet
+from .token_cache import AccessTokenCache
+
+
+# Plain-str claim values, so token paths skip the enum .value descriptor
+_TWO_LEGGED_VALUE: str = TokenType.TWO_LEGGED.value
+_THREE_LEGGED_VALUE: str = TokenType.THREE_LEGGED.value
+
+
+@lru_cache(maxsize=1)
+def _load_jwt_keys() -> tuple[Any, Any]:
+    """
+    Resolve the JWT signing and verification keys.
+    
+    HMAC algorithms (HS*) use the shared secret. Asymmetric algorithms
+    (e.g. EdDSA) parse the PEM keys into key objects. The result is cached,
+    so every AuthorizationService instance shares one parsed key pair.
+    
+    Returns:
+        Tuple of (signing_key, verifying_key)
+    """
+    if settings.jwt_algorithm.startswith("HS"):
+        return settings.jwt_secret_key, settings.jwt_secret_key
+    
+    from cryptography.hazmat.primitives.serialization import (
+        load_pem_private_key,
+        load_pem_public_key,
+    )
+    
+    signing_key = None
+    if settings.jwt_private_key_pem:
+        signing_key = load_pem_private_key(settings.jwt_private_key_pem.encode(), password=None)
+    
+    if settings.jwt_public_key_pem:
+        verifying_key = load_pem_public_key(settings.jwt_public_key_pem.encode())
+    elif signing_key is not None:
+        verifying_key = signing_key.public_key()
+    else:
+        raise ValueError(
+            f"JWT algorithm {settings.jwt_algorithm} requires JWT_PRIVATE_KEY_PEM or JWT_PUBLIC_KEY_PEM"
+        )
+    
+    return signing_key, verifying_key
+
+
+# Digest per HMAC JWT algorithm, for signing without PyJWT's generic encoder
+_HMAC_DIGESTS: Dict[str, Callable[..., Any]] = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+
+def _b64url(data: bytes) -> bytes:
+    """Unpadded base64url, as used for JWT segments."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _revocation_key(jti: str) -> str:
+    """Redis key marking a token identifier as revoked."""
+    return f"{REVOKED_PREFIX}{jti}"
+
+
+def _token_jti(jti: Any, token: str) -> str:
+    """Revocation identifier of a token, from its decoded ``jti`` claim.
+    
+    Tokens carry a random string ``jti``; ones issued before it was added
+    (or with a claim that is not a non-empty string) fall back to their
+    signature segment, which is just as unique.
+    """
+    if isinstance(jti, str) and jti:
+        return jti
+    return token.rpartition(".")[2]
+
+
+def _token_cache_key(token: str) -> str:
+    """Redis key for a validated token, derived from the token's SHA-256."""
+    return f"auth:tok:{hashlib.sha256(token.encode()).hexdigest()}"
 
 
 class AuthorizationService:
     """Service for generating and validating JWT access tokens with Redis caching."""
     
-    def __init__(self) -> None:
-        # Redis client for revocation list and rate limiting
-        self.redis_client = aioredis.from_url(settings.redis_url, decode_responses=True)
+    def __init__(self, redis_client: Optional[aioredis.Redis] = None) -> None:
+        # Redis client for revocation list and rate limiting (process-wide pool by default)
+        self.redis_client = redis_client if redis_client is not None else shared_redis_client
+        # Parsed once per process and shared across instances
+        self._signing_key, self._verifying_key = _load_jwt_keys()
+        # The JWT header never changes; HMAC tokens are signed directly from it
+        self._hmac_digest = _HMAC_DIGESTS.get(settings.jwt_algorithm)
+        self._header_b64 = _b64url(orjson.dumps({"alg": settings.jwt_algorithm, "typ": "JWT"}))
+        self._hmac_key = settings.jwt_secret_key.encode()
+        # Per-process cache in front of the Redis token cache
+        self.token_cache = AccessTokenCache()
+        # Local mirror of the revocation list, started on first use
+        self.revoked_tokens = RevokedTokenSet(self.redis_client)
     
     def _create_jwt_token(
         self,
         payload: dict[str, Any],
-        expires_in_minutes: int
-    ) -> str:
-        """Create a JWT token with the given payload."""
-        now = datetime.now(timezone.utc)
+        expires_in_minutes: int,
+        now: datetime
+    ) -> tuple[str, datetime, str]:
+        """Create a JWT token with the given payload, issued at ``now``.
+        
+        Returns:
+            Tuple of (token string, expiry timestamp, token id)
+        """
+        expires_at = now + timedelta(minutes=expires_in_minutes)
+        iat = int(now.timestamp())
+        jti = secrets.token_hex(8)
         payload.update({
-            "iat": now,
-            "exp": now + timedelta(minutes=expires_in_minutes),
-            "iss": "camarapsap"
+            "iat": iat,
+            "exp": iat + expires_in_minutes * 60,
+            "iss": "camarapsap",
+            # Short random id used as the revocation key instead of the whole token
+            "jti": jti,
         })
         
-        token = jwt.encode(
-            payload,
-            settings.jwt_secret_key,
-            algorithm=settings.jwt_algorithm
-        )
-        return token
+        if self._hmac_digest is None:
+            token = jwt.encode(
+                payload,
+                self._signing_key,
+                algorithm=settings.jwt_algorithm
+            )
+            return token, expires_at, jti
+        
+        # HMAC fast path: only the payload segment and signature vary per token
+        signing_input = self._header_b64 + b"." + _b64url(orjson.dumps(payload))
+        signature = hmac.new(self._hmac_key, signing_input, self._hmac_digest).digest()
+        return (signing_input + b"." + _b64url(signature)).decode("ascii"), expires_at, jti
     
     async def create_two_legged_token(
         self,
@@ -62,12 +174,13 @@ class AuthorizationService:
         payload = {
             "sub": client_id,
             "client_id": client_id,
-            "token_type": TokenType.TWO_LEGGED.value,
+            "token_type": _TWO_LEGGED_VALUE,
             "scopes": scopes,
         }
         
-        token_string = self._create_jwt_token(payload, expires_in_minutes)
-        expires_at = datetime.now(timezone.utc) + timedelta(minutes=expires_in_minutes)
+        token_string, expires_at, jti = self._create_jwt_token(
+            payload, expires_in_minutes, datetime.now(timezone.utc)
+        )
         
         access_token = AccessToken(
             token=token_string,
@@ -76,7 +189,8 @@ class AuthorizationService:
             scopes=scopes,
             client_id=client_id,
             user_id=None,
-            device_info=None
+            device_info=None,
+            jti=jti
         )
         
         return access_token
@@ -117,7 +231,7 @@ class AuthorizationService:
         payload: Dict[str, Any] = {
             "sub": user_id,
             "client_id": client_id,
-            "token_type": TokenType.THREE_LEGGED.value,
+            "token_type": _THREE_LEGGED_VALUE,
             "scopes": scopes,
             "user_id": user_id,
         }
@@ -125,8 +239,9 @@ class AuthorizationService:
         if device_info:
             payload["device"] = device_info.model_dump()
         
-        token_string = self._create_jwt_token(payload, expires_in_minutes)
-        expires_at = datetime.now(timezone.utc) + timedelta(minutes=expires_in_minutes)
+        token_string, expires_at, jti = self._create_jwt_token(
+            payload, expires_in_minutes, datetime.now(timezone.utc)
+        )
         
         access_token = AccessToken(
             token=token_string,
@@ -135,7 +250,8 @@ class AuthorizationService:
             scopes=scopes,
             client_id=client_id,
             user_id=user_id,
-            device_info=device_info
+            device_info=device_info,
+            jti=jti
         )
         
         return access_token
@@ -147,7 +263,10 @@ class AuthorizationService:
         Checks:
         1. JWT signature validity
         2. Token expiration
-        3. Token not in revocation list (Redis)
+        3. Token id (``jti``) not in revocation list (Redis)
+        
+        Previously validated tokens are served from the local and Redis
+        caches; the revocation check still runs for every call.
         
         Args:
             token: The JWT token string to validate
@@ -155,25 +274,41 @@ class AuthorizationService:
         Returns:
             AccessToken if valid, None if invalid or expired
         """
+        # Reject obviously malformed input before touching caches or PyJWT
+        if not token or token.count(".") != 2:
+            return None
+        
         try:
-            # Check if token is revoked
-            if await self.is_token_revoked(token):
-                return None
+            # Serve repeat callers from the validated-token caches
+            cache_key = _token_cache_key(token)
+            cached = self.token_cache.get(cache_key)
+            if cached is None:
+                cached = await self._get_cached_token(cache_key)
+                if cached is not None:
+                    self.token_cache.set(cache_key, cached)
+            if cached is not None:
+                if await self._is_revoked(_token_jti(cached.jti, token)):
+                    return None
+                return cached
             
             # Decode and verify JWT
             payload = jwt.decode(
                 token,
-                settings.jwt_secret_key,
+                self._verifying_key,
                 algorithms=[settings.jwt_algorithm],
                 options={"verify_exp": True}
             )
             
             # Extract token information
             token_type_str = payload.get("token_type")
-            token_type = TokenType.TWO_LEGGED if token_type_str == TokenType.TWO_LEGGED.value else TokenType.THREE_LEGGED
+            token_type = TokenType.TWO_LEGGED if token_type_str == _TWO_LEGGED_VALUE else TokenType.THREE_LEGGED
             
             expires_at = datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
             
+            jti = _token_jti(payload.get("jti"), token)
+            if await self._is_revoked(jti):
+                return None
+            
             access_token = AccessToken(
                 token=token,
                 token_type=token_type,
@@ -181,18 +316,58 @@ class AuthorizationService:
                 scopes=payload.get("scopes", []),
                 client_id=payload.get("client_id"),
                 user_id=payload.get("user_id"),
-                device_info=payload.get("device")
+                device_info=payload.get("device"),
+                jti=jti
             )
             
+            self.token_cache.set(cache_key, access_token)
+            await self._cache_token(cache_key, access_token)
+            
             return access_token
             
-        except jwt.ExpiredSignatureError:
-            return None
-        except jwt.InvalidTokenError:
+        except (jwt.PyJWTError, KeyError, ValueError):
+            # Bad signature/claims, missing exp, or a payload AccessToken rejects
             return None
+    
+    async def _get_cached_token(self, cache_key: str) -> Optional[AccessToken]:
+        """
+        Look up a previously validated token in Redis.
+        
+        Args:
+            cache_key: The token cache key
+        
+        Returns:
+            The cached AccessToken, or None on a miss or Redis error
+        """
+        try:
+            cached = await self.redis_client.get(cache_key)
+            if cached is None:
+                return None
+            return AccessToken.model_validate_json(cached)
         except Exception:
             return None
     
+    async def _cache_token(self, cache_key: str, access_token: AccessToken) -> None:
+        """
+        Store a validated token in Redis.
+        
+        The entry never outlives the token itself and is capped at
+        ``settings.token_cache_ttl_seconds`` to bound staleness.
+        
+        Args:
+            cache_key: The token cache key
+            access_token: The validated access token
+        """
+        remaining = int(access_token.expires_at.timestamp() - time.time())
+        ttl_seconds = min(remaining, settings.token_cache_ttl_seconds)
+        if ttl_seconds <= 0:
+            return
+        
+        try:
+            await self.redis_client.setex(cache_key, ttl_seconds, access_token.model_dump_json())
+        except Exception:
+            pass
+    
     async def revoke_token(self, token: str) -> bool:
         """
         Revoke a JWT access token by adding it to the Redis blacklist.
@@ -203,37 +378,66 @@ class AuthorizationService:
         Returns:
             True if token was revoked, False on error
         """
-        try:
-            # Decode to get expiration time
-            payload = jwt.decode(
-                token,
-                settings.jwt_secret_key,
-                algorithms=[settings.jwt_algorithm],
-                options={"verify_exp": False}
-            )
+        return await self.revoke_many([token]) == 1
+    
+    async def revoke_many(self, tokens: list[str]) -> int:
+        """
+        Revoke several JWT access tokens in a single Redis round-trip.
+        
+        Tokens are decoded locally first; the revocation entries and cache
+        evictions for all of them are then sent as one pipeline. Invalid or
+        already expired tokens are skipped.
+        
+        Args:
+            tokens: The token strings to revoke
+        
+        Returns:
+            Number of tokens revoked
+        """
+        now = time.time()
+        pending: list[tuple[str, str, int]] = []
+        for token in tokens:
+            if not token or token.count(".") != 2:
+                continue
+            try:
+                # Decode to get expiration time
+                payload = jwt.decode(
+                    token,
+                    self._verifying_key,
+                    algorithms=[settings.jwt_algorithm],
+                    options={"verify_exp": False}
+                )
+            except jwt.PyJWTError:
+                continue
             
             exp = payload.get("exp")
             if not exp:
-                return False
-            
-            # Calculate TTL until token would expire anyway
-            now = datetime.now(timezone.utc)
-            exp_time = datetime.fromtimestamp(exp, tz=timezone.utc)
-            ttl_seconds = int((exp_time - now).total_seconds())
+                continue
             
+            # TTL until token would expire anyway
+            ttl_seconds = int(exp - now)
             if ttl_seconds > 0:
-                # Add to revocation list with TTL
-                await self.redis_client.setex(
-                    f"revoked_token:{token}",
-                    ttl_seconds,
-                    "1"
-                )
-                return True
-            
-            return False
-            
-        except Exception:
-            return False
+                jti = _token_jti(payload.get("jti"), token)
+                pending.append((jti, _token_cache_key(token), ttl_seconds))
+        
+        if not pending:
+            return 0
+        
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for jti, cache_key, ttl_seconds in pending:
+                    # Add the token id to the revocation list with TTL and
+                    # drop any cached validation result for the token
+                    pipe.setex(_revocation_key(jti), ttl_seconds, "1")
+                    pipe.delete(cache_key)
+                await pipe.execute()
+        except RedisError:
+            return 0
+        
+        for jti, cache_key, _ in pending:
+            self.revoked_tokens.add(jti)
+            self.token_cache.delete(cache_key)
+        return len(pending)
     
     async def is_token_revoked(self, token: str) -> bool:
         """
@@ -246,7 +450,31 @@ class AuthorizationService:
             True if revoked, False otherwise
         """
         try:
-            result = await self.redis_client.exists(f"revoked_token:{token}")
+            payload = jwt.decode(token, options={"verify_signature": False})
+        except jwt.InvalidTokenError:
+            return False
+        return await self._is_revoked(_token_jti(payload.get("jti"), token))
+    
+    async def _is_revoked(self, jti: str) -> bool:
+        """
+        Check the revocation list for a token id.
+        
+        Answered from the local mirror while it is in sync with Redis,
+        otherwise from Redis directly.
+        
+        Args:
+            jti: The token's revocation identifier
+        
+        Returns:
+            True if revoked, False otherwise
+        """
+        if settings.revocation_mirror:
+            self.revoked_tokens.ensure_started()
+            if self.revoked_tokens.synced:
+                return jti in self.revoked_tokens
+        
+        try:
+            result = await self.redis_client.exists(_revocation_key(jti))
             # Redis returns an integer count of keys that exist
             return int(result) > 0
         except Exception:
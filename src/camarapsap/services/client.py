@@ -1,12 +1,80 @@
 """Client service for managing OAuth 2.0 clients."""
 
-from typing import Optional, List
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+from dataclasses import dataclass
+from typing import Any, Optional, List, Union, cast
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import CursorResult, Row, bindparam, select, update
+from cachetools import TTLCache
 import bcrypt
-import secrets
 
+from ..config import settings
 from ..db.models.client import Client
+from ..models.auth.token import scopes_to_mask
+
+
+@dataclass(frozen=True)
+class ClientSnapshot:
+    """Immutable, detached view of a client row used on the auth hot path."""
+    
+    client_id: str
+    client_secret_hash: str
+    allowed_scopes: tuple[str, ...]
+    allowed_scope_set: frozenset[str]
+    allowed_scope_mask: int
+    is_active: bool
+    
+    @classmethod
+    def from_model(cls, client: Union[Client, Row]) -> "ClientSnapshot":
+        """Build a snapshot from a Client ORM object or a row of its columns."""
+        return cls(
+            client_id=client.client_id,
+            client_secret_hash=client.client_secret_hash,
+            allowed_scopes=tuple(client.allowed_scopes),
+            allowed_scope_set=frozenset(client.allowed_scopes),
+            allowed_scope_mask=client.allowed_scope_mask,
+            is_active=client.is_active,
+        )
+
+
+# Built once: fetches just the snapshot columns as a plain row, skipping ORM
+# entity construction and identity-map bookkeeping
+_GET_CLIENT_STMT = select(
+    Client.client_id,
+    Client.client_secret_hash,
+    Client.allowed_scopes,
+    Client.allowed_scope_mask,
+    Client.is_active,
+).where(Client.client_id == bindparam("client_id"))
+
+# UPDATE reserves column names for SET binds, hence the distinct bind name
+_DEACTIVATE_CLIENT_STMT = (
+    update(Client)
+    .where(Client.client_id == bindparam("target_client_id"))
+    .values(is_active=False)
+)
+
+
+# Recently loaded clients, keyed by client_id (the clients table changes rarely)
+_client_cache: TTLCache[str, ClientSnapshot] = TTLCache(
+    maxsize=1024, ttl=settings.client_cache_ttl_seconds
+)
+
+# Recently authenticated clients, keyed by (client_id, HMAC digest of the secret).
+# The HMAC key never leaves this process, so the cache holds no reusable secret.
+_secret_digest_key = os.urandom(32)
+_authenticated_clients: TTLCache[tuple[str, bytes], ClientSnapshot] = TTLCache(
+    maxsize=1024, ttl=settings.secret_cache_ttl_seconds
+)
+
+
+def _secret_digest(secret: str) -> bytes:
+    """HMAC-SHA256 of a client secret under the process-local key."""
+    return hmac.new(_secret_digest_key, secret.encode('utf-8'), hashlib.sha256).digest()
 
 
 class ClientService:
@@ -17,7 +85,7 @@ class ClientService:
         """Hash a client secret using bcrypt."""
         # Convert to bytes and hash
         secret_bytes = secret.encode('utf-8')
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=settings.bcrypt_cost)
         hashed = bcrypt.hashpw(secret_bytes, salt)
         return hashed.decode('utf-8')
     
@@ -31,7 +99,42 @@ class ClientService:
     @staticmethod
     def generate_client_secret(length: int = 24) -> str:
         """Generate a secure random client secret (max 24 chars for bcrypt)."""
-        return secrets.token_urlsafe(length)
+        return base64.urlsafe_b64encode(os.urandom(length)).rstrip(b"=").decode("ascii")
+    
+    @staticmethod
+    def add_client_row(
+        session: AsyncSession,
+        client_id: str,
+        client_name: str,
+        allowed_scopes: List[str],
+        client_secret_hash: str
+    ) -> Client:
+        """
+        Add a new client row to the session without committing.
+        
+        Lets callers hash secrets up front and persist several clients
+        in a single transaction.
+        
+        Args:
+            session: Database session
+            client_id: Unique client identifier
+            client_name: Human-readable client name
+            allowed_scopes: List of scopes this client can request
+            client_secret_hash: Pre-computed bcrypt hash of the client secret
+        
+        Returns:
+            The pending Client object
+        """
+        client = Client(
+            client_id=client_id,
+            client_secret_hash=client_secret_hash,
+            client_name=client_name,
+            allowed_scopes=allowed_scopes,
+            allowed_scope_mask=scopes_to_mask(allowed_scopes),
+            is_active=True
+        )
+        session.add(client)
+        return client
     
     @staticmethod
     async def create_client(
@@ -57,46 +160,67 @@ class ClientService:
         if client_secret is None:
             client_secret = ClientService.generate_client_secret()
         
-        client = Client(
+        # bcrypt is CPU-bound; hash in a worker thread to keep the event loop free
+        client_secret_hash = await asyncio.to_thread(ClientService.hash_secret, client_secret)
+        
+        client = ClientService.add_client_row(
+            session=session,
             client_id=client_id,
-            client_secret_hash=ClientService.hash_secret(client_secret),
             client_name=client_name,
             allowed_scopes=allowed_scopes,
-            is_active=True
+            client_secret_hash=client_secret_hash
         )
         
-        session.add(client)
         await session.commit()
         await session.refresh(client)
+        ClientService.invalidate_cache(client_id)
         
         return client, client_secret
     
+    @staticmethod
+    def invalidate_cache(client_id: str) -> None:
+        """Drop a client from the in-memory client and authentication caches."""
+        _client_cache.pop(client_id, None)
+        for key in [key for key in _authenticated_clients if key[0] == client_id]:
+            _authenticated_clients.pop(key, None)
+    
     @staticmethod
     async def get_client(
         session: AsyncSession,
         client_id: str
-    ) -> Optional[Client]:
+    ) -> Optional[ClientSnapshot]:
         """
         Get a client by ID.
         
+        Results are served from a short-lived in-memory cache so repeat
+        lookups skip the database round-trip.
+        
         Args:
             session: Database session
             client_id: Client identifier
         
         Returns:
-            Client object if found, None otherwise
+            ClientSnapshot if found, None otherwise
         """
-        result = await session.execute(
-            select(Client).where(Client.client_id == client_id)
-        )
-        return result.scalar_one_or_none()
+        cached = _client_cache.get(client_id)
+        if cached is not None:
+            return cached
+        
+        result = await session.execute(_GET_CLIENT_STMT, {"client_id": client_id})
+        row = result.first()
+        if row is None:
+            return None
+        
+        snapshot = ClientSnapshot.from_model(row)
+        _client_cache[client_id] = snapshot
+        return snapshot
     
     @staticmethod
     async def authenticate_client(
         session: AsyncSession,
         client_id: str,
         client_secret: str
-    ) -> Optional[Client]:
+    ) -> Optional[ClientSnapshot]:
         """
         Authenticate a client using credentials.
         
@@ -106,9 +230,23 @@ class ClientService:
             client_secret: Client secret
         
         Returns:
-            Client object if authenticated, None otherwise
+            ClientSnapshot if authenticated, None otherwise
         """
+        # Credentials that already passed bcrypt skip it (the first attempt per
+        # process still pays the full cost), but the client is re-read through
+        # the client cache so a deactivation or secret rotation made by another
+        # process takes effect within client_cache_ttl_seconds
+        cache_key = (client_id, _secret_digest(client_secret))
+        cached = _authenticated_clients.get(cache_key)
         client = await ClientService.get_client(session, client_id)
+        if cached is not None:
+            if (
+                client is not None
+                and client.is_active
+                and client.client_secret_hash == cached.client_secret_hash
+            ):
+                return client
+            _authenticated_clients.pop(cache_key, None)
         
         if not client:
             return None
@@ -116,27 +254,30 @@ class ClientService:
         if not client.is_active:
             return None
         
-        if not ClientService.verify_secret(client_secret, client.client_secret_hash):
+        if not await asyncio.to_thread(
+            ClientService.verify_secret, client_secret, client.client_secret_hash
+        ):
             return None
         
+        _authenticated_clients[cache_key] = client
         return client
     
     @staticmethod
     async def validate_scopes(
-        client: Client,
+        client: ClientSnapshot,
         requested_scopes: List[str]
     ) -> bool:
         """
         Check if requested scopes are allowed for the client.
         
         Args:
-            client: Client object
+            client: Client snapshot
             requested_scopes: List of requested scopes
         
         Returns:
             True if all scopes are allowed, False otherwise
         """
-        return all(scope in client.allowed_scopes for scope in requested_scopes)
+        return client.allowed_scope_set.issuperset(requested_scopes)
     
     @staticmethod
     async def deactivate_client(
@@ -153,11 +294,12 @@ class ClientService:
         Returns:
             True if deactivated, False if not found
         """
-        client = await ClientService.get_client(session, client_id)
-        
-        if not client:
-            return False
-        
-        client.is_active = False
+        # DML executes return a CursorResult, which carries rowcount
+        result = cast(
+            CursorResult[Any],
+            await session.execute(_DEACTIVATE_CLIENT_STMT, {"target_client_id": client_id}),
+        )
         await session.commit()
-        return True
+        ClientService.invalidate_cache(client_id)
+        
+        return bool(result.rowcount)
@@ -0,0 +1,248 @@
+"""Device resolution shared by the identifier and location services."""
+
+import asyncio
+from itertools import product
+from typing import Optional, Tuple, cast
+from sqlalchemy import Executable, Integer, String, and_, bindparam, inspect, literal_column, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import load_only
+from ..config import settings
+from ..db.database import AsyncSessionLocal
+from ..db.models import Device
+from ..db.models.device import LOOKUP_COLUMNS
+from ..db.models.device_ppid import DevicePPID
+from ..models.common import Device as DeviceInput
+
+# Supplied identifier values in match priority order, None when absent
+IdentifierKey = Tuple[Optional[str], Optional[str], Optional[str]]
+# Which identifiers a lookup supplies, in match priority order
+IdentifierKind = Tuple[bool, bool, bool]
+# A resolved device and the identifier that matched it, or (None, None)
+DeviceMatch = Tuple[Optional[Device], Optional[str]]
+
+# Lookup identifiers in match priority order: their column names (also the
+# bind parameter names of the lookup statements) and the matched_by labels
+_IDENTIFIER_COLUMNS = ("phone_number", "network_access_identifier", "ipv4_public_address")
+_MATCHED_BY = ("phoneNumber", "networkAccessIdentifier", "ipv4Address")
+
+# Lookups select only the columns the lookup indexes carry; anything else
+# raises on access rather than lazy-loading (unsupported under AsyncSession)
+_PROJECTION = tuple(getattr(Device, column) for column in LOOKUP_COLUMNS)
+_LOAD_PROJECTION = load_only(*_PROJECTION, raiseload=True)
+
+_PRIORITY = literal_column("pri", Integer)
+_PPID = literal_column("ppid", String)
+_ID = literal_column("id", Integer)
+
+# Session.info slot holding the lookups resolved during the session
+_SESSION_MEMO = "device_lookup"
+
+
+def _device_lookup_stmt(kind: IdentifierKind, with_ppid: bool) -> Executable:
+    """Build a device lookup for the identifiers flagged in ``kind``.
+    
+    Each supplied identifier gets one indexed UNION ALL branch tagged with
+    its match priority, and the first row by priority, then lowest device id
+    (IPv4 addresses are shared behind NAT), wins. A single identifier needs
+    no UNION. With ``with_ppid``
+    each branch also outer-joins the device's PPID for the ``client_id`` bind.
+    """
+    branches = []
+    for priority, (column, supplied) in enumerate(zip(_IDENTIFIER_COLUMNS, kind)):
+        if not supplied:
+            continue
+        branch = select(*_PROJECTION, literal_column(str(priority), Integer).label("pri"))
+        if with_ppid:
+            branch = branch.add_columns(DevicePPID.ppid).outerjoin(
+                DevicePPID,
+                and_(
+                    DevicePPID.device_id == Device.id,
+                    DevicePPID.client_id == bindparam("client_id"),
+                ),
+            )
+        branches.append(branch.where(getattr(Device, column) == bindparam(column)))
+    columns = (Device, _PRIORITY, _PPID) if with_ppid else (Device, _PRIORITY)
+    if len(branches) == 1:
+        return select(*columns).from_statement(
+            branches[0].order_by(Device.id).limit(1)
+        ).options(_LOAD_PROJECTION)
+    return select(*columns).from_statement(
+        union_all(*branches).order_by(_PRIORITY, _ID).limit(1)
+    ).options(_LOAD_PROJECTION)
+
+
+def _device_batch_stmt() -> Executable:
+    """Build a lookup of every device matching any of a batch of identifiers.
+    
+    One UNION ALL branch per identifier column, each an indexed ``IN`` over an
+    expanding bind named after the column; an empty list matches nothing.
+    """
+    branches = [
+        select(*_PROJECTION).where(getattr(Device, column).in_(bindparam(column, expanding=True)))
+        for column in _IDENTIFIER_COLUMNS
+    ]
+    return select(Device).from_statement(union_all(*branches)).options(_LOAD_PROJECTION)
+
+
+# Built once at import, one per combination of supplied identifiers, so
+# SQLAlchemy's compiled cache is hit and no query carries a dead branch
+_KINDS = [
+    cast(IdentifierKind, kind)
+    for kind in product((False, True), repeat=len(_IDENTIFIER_COLUMNS))
+    if any(kind)
+]
+_GET_DEVICE_STMTS = {kind: _device_lookup_stmt(kind, with_ppid=False) for kind in _KINDS}
+_GET_DEVICE_PPID_STMTS = {kind: _device_lookup_stmt(kind, with_ppid=True) for kind in _KINDS}
+_GET_DEVICES_BATCH_STMT = _device_batch_stmt()
+
+
+class DeviceLoader:
+    """Coalesces device lookups from concurrent requests into one query.
+    
+    Lookups arriving within ``window`` seconds of the first pending one are
+    resolved together by a single batched query on a session of the loader's
+    own, so N concurrent requests cost one round-trip instead of N. Identical
+    lookups in a batch share one result. Returned devices are detached with
+    their columns loaded; they must not be used to navigate relationships.
+    """
+    
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession], window: float) -> None:
+        self._session_factory = session_factory
+        self._window = window
+        self._pending: dict[IdentifierKey, asyncio.Future[DeviceMatch]] = {}
+        # Strong references to in-flight batches so they are not garbage collected
+        self._batches: set[asyncio.Task[None]] = set()
+    
+    async def load(self, key: IdentifierKey) -> DeviceMatch:
+        """Resolve the device for ``key`` as part of the next batch."""
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            if not self._pending:
+                loop.call_later(self._window, self._dispatch)
+            self._pending[key] = future
+        # A cancelled caller must not cancel the result other callers share
+        return await asyncio.shield(future)
+    
+    def _dispatch(self) -> None:
+        batch, self._pending = self._pending, {}
+        task = asyncio.get_running_loop().create_task(self._resolve(batch))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+    
+    async def _resolve(self, batch: dict[IdentifierKey, asyncio.Future[DeviceMatch]]) -> None:
+        values: list[set[str]] = [set() for _ in _IDENTIFIER_COLUMNS]
+        for key in batch:
+            for index, value in enumerate(key):
+                if value is not None:
+                    values[index].add(value)
+        params = {column: sorted(values[index]) for index, column in enumerate(_IDENTIFIER_COLUMNS)}
+        try:
+            async with self._session_factory() as session:
+                devices = (await session.execute(_GET_DEVICES_BATCH_STMT, params)).scalars().all()
+        except Exception as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        
+        # Index the rows per identifier; IPv4 addresses are shared behind NAT,
+        # so the lowest device id wins as it would for a single lookup's LIMIT 1
+        matches: list[dict[str, Device]] = [{} for _ in _IDENTIFIER_COLUMNS]
+        for device in sorted(devices, key=lambda device: device.id, reverse=True):
+            for index, column in enumerate(_IDENTIFIER_COLUMNS):
+                value = getattr(device, column)
+                if value is not None:
+                    matches[index][value] = device
+        
+        for key, future in batch.items():
+            if future.done():
+                continue
+            found: DeviceMatch = (None, None)
+            for index, value in enumerate(key):
+                device = matches[index].get(value) if value is not None else None
+                if device is not None:
+                    found = (device, _MATCHED_BY[index])
+                    break
+            future.set_result(found)
+
+
+device_loader = DeviceLoader(AsyncSessionLocal, settings.device_batch_window_ms / 1000)
+
+
+def identifier_key(device_input: DeviceInput) -> IdentifierKey:
+    """Identifier values a lookup for ``device_input`` depends on."""
+    return (
+        device_input.phone_number or None,
+        device_input.network_access_identifier or None,
+        device_input.ipv4_address.public_address if device_input.ipv4_address else None,
+    )
+
+
+def _lookup(key: IdentifierKey) -> Tuple[IdentifierKind, dict[str, str]]:
+    """Kind of a lookup and the bind parameters for its supplied identifiers."""
+    kind = cast(IdentifierKind, tuple(value is not None for value in key))
+    return kind, {column: value for column, value in zip(_IDENTIFIER_COLUMNS, key) if value is not None}
+
+
+async def find_device(db: AsyncSession, device_input: DeviceInput) -> DeviceMatch:
+    """Resolve a device from its identifiers.
+    
+    Results are remembered for the lifetime of the session (one request), so
+    every service resolving the same identifiers shares a single lookup.
+    When batching is enabled (``device_batch_window_ms`` > 0) lookups that
+    reach the database go through ``device_loader``, and the device comes
+    back detached from a session of the loader's own rather than attached
+    to ``db``: read its columns, but neither modify it nor navigate its
+    relationships.
+    
+    Returns:
+        Tuple of (Device, matched_property) where matched_property is the
+        identifier that matched ('phoneNumber', 'networkAccessIdentifier',
+        'ipv4Address'), or (None, None) if no device matches
+    """
+    key = identifier_key(device_input)
+    memo: dict[IdentifierKey, DeviceMatch] = db.info.setdefault(_SESSION_MEMO, {})
+    found = memo.get(key)
+    # An expired device would lazy-load on attribute access; resolve it afresh
+    if found is not None and (found[0] is None or not inspect(found[0]).expired_attributes):
+        return found
+    
+    found = (None, None)
+    if any(key):
+        if settings.device_batch_window_ms > 0:
+            found = await device_loader.load(key)
+        else:
+            kind, params = _lookup(key)
+            result = await db.execute(_GET_DEVICE_STMTS[kind], params)
+            row = result.first()
+            if row is not None:
+                found = (row[0], _MATCHED_BY[row[1]])
+    
+    memo[key] = found
+    return found
+
+
+async def find_device_with_ppid(
+    db: AsyncSession, device_input: DeviceInput, client_id: str
+) -> Tuple[Optional[Device], Optional[str], Optional[str]]:
+    """Resolve a device and its PPID for ``client_id`` in one round-trip.
+    
+    Returns:
+        Tuple of (Device, matched_property, ppid); ppid is None when the
+        device has none for this client, and all three are None when no
+        device matches
+    """
+    key = identifier_key(device_input)
+    if not any(key):
+        return None, None, None
+    
+    kind, params = _lookup(key)
+    result = await db.execute(_GET_DEVICE_PPID_STMTS[kind], {**params, "client_id": client_id})
+    row = result.first()
+    if row is None:
+        return None, None, None
+    
+    device, priority, ppid = row
+    return device, _MATCHED_BY[priority], ppid
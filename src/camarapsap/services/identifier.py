@@ -1,21 +1,100 @@
 """Device identifier service layer."""
 
 from datetime import datetime, timezone
-from typing import Optional, Tuple
-from sqlalchemy.orm import Session
+from functools import lru_cache
+import hashlib
+from typing import Awaitable, Callable, Optional, Tuple, Union
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+from ..config import settings
 from ..db.models import Device
-from ..db.models.device_ppid import DevicePPID as DevicePPIDModel
-from ..models.device_identifier import DeviceIdentifier, DeviceType, DevicePPID
+from ..models.device_identifier import DeviceIdentifier, DeviceType, DevicePPID, dump_identifier_response
 from ..models.common import Device as DeviceInput, DeviceResponse
 from ..models.common.device_ipv4 import DeviceIpv4Addr
+from ..models.error_models.camara_errors import IDENTIFIER_NOT_FOUND
+from .device_lookup import IdentifierKey, find_device, find_device_with_ppid, identifier_key
+from .redis_client import redis_client as shared_redis_client
+
+
+def _result_cache_key(kind: str, identifiers: IdentifierKey) -> str:
+    """Redis key for a serialized response, derived from the supplied identifiers."""
+    digest = hashlib.sha256("\0".join(v or "" for v in identifiers).encode()).hexdigest()
+    return f"devid:{kind}:{digest}"
+
+
+def _identifier_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail={
+            "code": IDENTIFIER_NOT_FOUND,
+            "message": "Device identifier provided cannot be matched to a device"
+        }
+    )
+
+
+# Response models below are built with model_construct: their values come
+# from typed database columns, so pydantic validation would only re-check them
+_EMPTY_DEVICE_RESPONSE = DeviceResponse.model_construct(
+    phone_number=None,
+    network_access_identifier=None,
+    ipv4_address=None,
+    ipv6_address=None
+)
+
+
+# DeviceResponse is frozen, so one instance is shared by every response for
+# the same identifier. Keyed on the column values themselves, an entry can
+# never go stale when a device row changes.
+@lru_cache(maxsize=4096)
+def _phone_number_response(phone_number: Optional[str]) -> DeviceResponse:
+    return _EMPTY_DEVICE_RESPONSE.model_copy(update={"phone_number": phone_number})
+
+
+@lru_cache(maxsize=4096)
+def _network_access_identifier_response(network_access_identifier: Optional[str]) -> DeviceResponse:
+    return _EMPTY_DEVICE_RESPONSE.model_copy(
+        update={"network_access_identifier": network_access_identifier}
+    )
+
+
+@lru_cache(maxsize=4096)
+def _ipv4_address_response(
+    public_address: Optional[str],
+    private_address: Optional[str],
+    public_port: Optional[int],
+) -> DeviceResponse:
+    if not public_address:
+        return _EMPTY_DEVICE_RESPONSE
+    return _EMPTY_DEVICE_RESPONSE.model_copy(update={
+        "ipv4_address": DeviceIpv4Addr.model_construct(
+            public_address=public_address,
+            private_address=private_address,
+            public_port=public_port
+        )
+    })
+
+
+# matched_by -> builder of the response exposing only that identifier
+_DEVICE_RESPONSE_BUILDERS: dict[str, Callable[[Device], DeviceResponse]] = {
+    "phoneNumber": lambda device: _phone_number_response(device.phone_number),
+    "networkAccessIdentifier": lambda device: _network_access_identifier_response(
+        device.network_access_identifier
+    ),
+    "ipv4Address": lambda device: _ipv4_address_response(
+        device.ipv4_public_address, device.ipv4_private_address, device.ipv4_public_port
+    ),
+}
 
 
 class DeviceIdentifierService:
     """Service for device identifier operations."""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession, redis_client: Optional[aioredis.Redis] = None):
         self.db = db
+        # Serialized identifier/type responses are cached here (process-wide pool by default)
+        self.redis_client = redis_client if redis_client is not None else shared_redis_client
     
     def _create_device_response(self, device: Device, matched_by: str) -> DeviceResponse:
         """Create a DeviceResponse with only the matched identifier.
@@ -27,42 +106,13 @@ class DeviceIdentifierService:
         Returns:
             DeviceResponse with only the matched identifier populated
         """
-        if matched_by == "phoneNumber":
-            return DeviceResponse(
-                phoneNumber=device.phone_number,
-                networkAccessIdentifier=None,
-                ipv4Address=None,
-                ipv6Address=None
-            )
-        elif matched_by == "networkAccessIdentifier":
-            return DeviceResponse(
-                phoneNumber=None,
-                networkAccessIdentifier=device.network_access_identifier,
-                ipv4Address=None,
-                ipv6Address=None
-            )
-        elif matched_by == "ipv4Address":
-            if device.ipv4_public_address:
-                return DeviceResponse(
-                    phoneNumber=None,
-                    networkAccessIdentifier=None,
-                    ipv4Address=DeviceIpv4Addr(
-                        publicAddress=device.ipv4_public_address,
-                        privateAddress=device.ipv4_private_address,
-                        publicPort=device.ipv4_public_port
-                    ),
-                    ipv6Address=None
-                )
-        
-        # Fallback - return None for all fields if no valid match
-        return DeviceResponse(
-            phoneNumber=None,
-            networkAccessIdentifier=None,
-            ipv4Address=None,
-            ipv6Address=None
-        )
+        builder = _DEVICE_RESPONSE_BUILDERS.get(matched_by)
+        if builder is None:
+            # Fallback - return None for all fields if no valid match
+            return _EMPTY_DEVICE_RESPONSE
+        return builder(device)
     
-    def get_device(self, device_input: DeviceInput) -> Tuple[Device, str]:
+    async def get_device(self, device_input: DeviceInput) -> Tuple[Device, str]:
         """Get existing device based on input identifiers.
         
         Returns:
@@ -73,49 +123,21 @@ class DeviceIdentifierService:
         Raises:
             HTTPException: 404 IDENTIFIER_NOT_FOUND if device is not found
         """
-        # Try to find existing device by phone number
-        if device_input.phone_number:
-            device = self.db.query(Device).filter(
-                Device.phone_number == device_input.phone_number
-            ).first()
-            if device:
-                return device, "phoneNumber"
-        
-        # Try to find by network access identifier
-        if device_input.network_access_identifier:
-            device = self.db.query(Device).filter(
-                Device.network_access_identifier == device_input.network_access_identifier
-            ).first()
-            if device:
-                return device, "networkAccessIdentifier"
-        
-        # Try to find by IPv4 address
-        if device_input.ipv4_address:
-            device = self.db.query(Device).filter(
-                Device.ipv4_public_address == device_input.ipv4_address.public_address
-            ).first()
-            if device:
-                return device, "ipv4Address"
-        
-        # Device not found - raise 404 error
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "code": "IDENTIFIER_NOT_FOUND",
-                "message": "Device identifier provided cannot be matched to a device"
-            }
-        )
+        device, matched_by = await find_device(self.db, device_input)
+        if device is None or matched_by is None:
+            raise _identifier_not_found()
+        return device, matched_by
 
-    def retrieve_identifier(self, device_input: DeviceInput) -> DeviceIdentifier:
+    async def retrieve_identifier(self, device_input: DeviceInput) -> DeviceIdentifier:
         """Retrieve device identifier information.
         
         Raises:
             HTTPException: 404 IDENTIFIER_NOT_FOUND if device is not found
         """
-        device, matched_by = self.get_device(device_input)
+        device, matched_by = await self.get_device(device_input)
         
-        return DeviceIdentifier(
-            lastChecked=device.last_checked,
+        return DeviceIdentifier.model_construct(
+            last_checked=device.last_checked,
             imei=device.imei,
             imeisv=device.imeisv,
             tac=device.tac,
@@ -124,23 +146,70 @@ class DeviceIdentifierService:
             device=self._create_device_response(device, matched_by)
         )
     
-    def retrieve_type(self, device_input: DeviceInput) -> DeviceType:
+    async def retrieve_type(self, device_input: DeviceInput) -> DeviceType:
         """Retrieve device type information.
         
         Raises:
             HTTPException: 404 IDENTIFIER_NOT_FOUND if device is not found
         """
-        device, matched_by = self.get_device(device_input)
+        device, matched_by = await self.get_device(device_input)
         
-        return DeviceType(
-            lastChecked=device.last_checked,
+        return DeviceType.model_construct(
+            last_checked=device.last_checked,
             tac=device.tac,
             manufacturer=device.manufacturer,
             model=device.model,
             device=self._create_device_response(device, matched_by)
         )
     
-    def retrieve_ppid(self, device_input: DeviceInput, client_id: str) -> DevicePPID:
+    async def retrieve_identifier_json(self, device_input: DeviceInput) -> bytes:
+        """Serialized retrieve_identifier response, served from Redis when cached.
+        
+        Raises:
+            HTTPException: 404 IDENTIFIER_NOT_FOUND if device is not found
+        """
+        return await self._cached_json("identifier", device_input, self.retrieve_identifier)
+    
+    async def retrieve_type_json(self, device_input: DeviceInput) -> bytes:
+        """Serialized retrieve_type response, served from Redis when cached.
+        
+        Raises:
+            HTTPException: 404 IDENTIFIER_NOT_FOUND if device is not found
+        """
+        return await self._cached_json("type", device_input, self.retrieve_type)
+    
+    async def _cached_json(
+        self,
+        kind: str,
+        device_input: DeviceInput,
+        retrieve: Callable[[DeviceInput], Awaitable[Union[DeviceIdentifier, DeviceType]]],
+    ) -> bytes:
+        """Return a cached response body, or build, cache and return it.
+        
+        Device metadata changes rarely, so hits skip the database and model
+        construction entirely. Entries live ``settings.device_cache_ttl_seconds``;
+        Redis failures fall through to the uncached path.
+        """
+        cache_key = _result_cache_key(kind, identifier_key(device_input))
+        try:
+            cached = await self.redis_client.get(cache_key)
+            # The shared client decodes responses to str; accept raw bytes too
+            if isinstance(cached, str):
+                return cached.encode()
+            if isinstance(cached, bytes):
+                return cached
+        except RedisError:
+            pass
+        
+        body = dump_identifier_response(await retrieve(device_input))
+        
+        try:
+            await self.redis_client.setex(cache_key, settings.device_cache_ttl_seconds, body)
+        except RedisError:
+            pass
+        return body
+    
+    async def retrieve_ppid(self, device_input: DeviceInput, client_id: str) -> DevicePPID:
         """Retrieve pseudonymous device identifier for a specific client.
         
         Args:
@@ -151,15 +220,12 @@ class DeviceIdentifierService:
             HTTPException: 404 IDENTIFIER_NOT_FOUND if device is not found
             HTTPException: 422 if device exists but ppid not set for this client
         """
-        device, matched_by = self.get_device(device_input)
-        
-        # Query the device_ppid table for this device-client pair
-        ppid_record = self.db.query(DevicePPIDModel).filter(
-            DevicePPIDModel.device_id == device.id,
-            DevicePPIDModel.client_id == client_id
-        ).first()
+        # Resolve the device and its PPID for this client in one round-trip
+        device, matched_by, ppid = await find_device_with_ppid(self.db, device_input, client_id)
+        if device is None or matched_by is None:
+            raise _identifier_not_found()
         
-        if not ppid_record:
+        if ppid is None:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail={
@@ -168,8 +234,8 @@ class DeviceIdentifierService:
                 }
             )
         
-        return DevicePPID(
-            lastChecked=device.last_checked,
-            ppid=ppid_record.ppid,
+        return DevicePPID.model_construct(
+            last_checked=device.last_checked,
+            ppid=ppid,
             device=self._create_device_response(device, matched_by)
         )
@@ -0,0 +1,13 @@
+"""Shared Redis client for the API process."""
+
+from redis import asyncio as aioredis
+from ..config import settings
+
+# One pool for every service; connections are created lazily on first use
+redis_client = aioredis.from_url(
+    settings.redis_url,
+    decode_responses=True,
+    max_connections=settings.redis_max_connections,
+    socket_keepalive=True,
+    health_check_interval=settings.redis_health_check_interval,
+)
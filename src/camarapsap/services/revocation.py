@@ -0,0 +1,117 @@
+"""In-process mirror of the Redis token revocation list."""
+
+import asyncio
+import logging
+import time
+from typing import Optional
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# Revocation entries live under this prefix (see AuthorizationService.revoke_token)
+REVOKED_PREFIX = "rt:"
+
+# Keyspace events the mirror relies on: $ = string commands (SET/SETEX),
+# g = generic (DEL), x = expired; E = publish on __keyevent@<db>__ channels
+_REQUIRED_EVENT_FLAGS = frozenset("E$gx")
+# "A" in notify-keyspace-events is shorthand for these classes
+_ALL_EVENT_CLASSES = "g$lshzxetd"
+
+# Wait before restarting a listener that failed, so an unreachable Redis
+# is not hammered with reconnects from every request
+_RETRY_SECONDS = 30.0
+
+
+class RevokedTokenSet:
+    """Local copy of revoked token ids, kept current by Redis keyspace events.
+    
+    Revocation is rare, so asking Redis on every request mostly confirms that a
+    token is *not* revoked. A background task loads the existing ``rt:*`` keys
+    and then follows ``set``/``del``/``expired`` notifications, letting the
+    common case be answered from memory. Until the mirror is synced (or after
+    its listener dies) ``synced`` is False and callers must ask Redis instead.
+    
+    The Redis server must already publish the events (``notify-keyspace-events``
+    including ``E$gx``); the mirror never changes server configuration and
+    stays off when they are missing.
+    """
+    
+    def __init__(self, redis_client: aioredis.Redis) -> None:
+        self.redis_client = redis_client
+        self._revoked: set[str] = set()
+        self._synced = False
+        self._task: Optional[asyncio.Task[None]] = None
+        self._retry_at = 0.0
+    
+    @property
+    def synced(self) -> bool:
+        """Whether the local set currently mirrors Redis."""
+        return self._synced
+    
+    def __contains__(self, jti: str) -> bool:
+        return jti in self._revoked
+    
+    def add(self, jti: str) -> None:
+        """Record a revocation made by this process without waiting for its event."""
+        self._revoked.add(jti)
+    
+    def ensure_started(self) -> None:
+        """Start (or restart after a failure) the listener on the running loop."""
+        if self._task is not None and not self._task.done():
+            return
+        now = time.monotonic()
+        if now < self._retry_at:
+            return
+        self._retry_at = now + _RETRY_SECONDS
+        self._task = asyncio.get_running_loop().create_task(self._listen())
+    
+    async def _notifications_enabled(self) -> bool:
+        """Whether Redis publishes the keyspace events the mirror follows."""
+        config = await self.redis_client.config_get("notify-keyspace-events")
+        current = config.get("notify-keyspace-events") or ""
+        flags = set(current.replace("A", _ALL_EVENT_CLASSES))
+        return _REQUIRED_EVENT_FLAGS <= flags
+    
+    async def _listen(self) -> None:
+        db = self.redis_client.connection_pool.connection_kwargs.get("db", 0)
+        pubsub = self.redis_client.pubsub()
+        try:
+            if not await self._notifications_enabled():
+                logger.warning(
+                    "Redis notify-keyspace-events lacks %s; revocation checks will query Redis",
+                    "".join(sorted(_REQUIRED_EVENT_FLAGS)),
+                )
+                return
+            # Subscribe before loading so no revocation falls between the two
+            await pubsub.subscribe(
+                f"__keyevent@{db}__:set",
+                f"__keyevent@{db}__:del",
+                f"__keyevent@{db}__:expired",
+            )
+            async for key in self.redis_client.scan_iter(match=f"{REVOKED_PREFIX}*"):
+                self._revoked.add(key[len(REVOKED_PREFIX):])
+            self._synced = True
+            
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                key = message["data"]
+                channel = message["channel"]
+                # decode_responses yields str; anything else is not ours to track
+                if not isinstance(key, str) or not isinstance(channel, str):
+                    continue
+                if not key.startswith(REVOKED_PREFIX):
+                    continue
+                jti = key[len(REVOKED_PREFIX):]
+                if channel.endswith(":set"):
+                    self._revoked.add(jti)
+                else:
+                    self._revoked.discard(jti)
+        except (RedisError, OSError) as exc:
+            # Redis went away or refused CONFIG GET; callers fall back to Redis lookups
+            logger.warning("Revocation mirror stopped: %s", exc)
+        finally:
+            self._synced = False
+            self._revoked.clear()
+            await pubsub.aclose()
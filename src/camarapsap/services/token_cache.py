@@ -0,0 +1,51 @@
+"""In-process cache of validated access tokens."""
+
+from typing import Optional
+from cachetools import TTLCache
+
+from ..config import settings
+from ..models.auth.token import AccessToken
+
+
+class AccessTokenCache:
+    """Short-lived in-memory cache of validated access tokens.
+    
+    Sits in front of the Redis token cache so repeat requests from the same
+    caller skip both the Redis round-trip and JWT verification. Entries live
+    at most ``settings.token_cache_ttl_seconds`` and are never returned past
+    the token's own expiry.
+    """
+    
+    def __init__(self, maxsize: int = 4096, ttl: Optional[int] = None) -> None:
+        self._cache: TTLCache[str, AccessToken] = TTLCache(
+            maxsize=maxsize,
+            ttl=settings.token_cache_ttl_seconds if ttl is None else ttl
+        )
+    
+    def get(self, key: str) -> Optional[AccessToken]:
+        """
+        Return a cached token that has not yet expired.
+        
+        Args:
+            key: Token cache key (digest of the token string)
+        
+        Returns:
+            The cached AccessToken, or None on a miss
+        """
+        access_token = self._cache.get(key)
+        if access_token is None:
+            return None
+        
+        if access_token.is_expired():
+            self._cache.pop(key, None)
+            return None
+        
+        return access_token
+    
+    def set(self, key: str, access_token: AccessToken) -> None:
+        """Cache a validated token."""
+        self._cache[key] = access_token
+    
+    def delete(self, key: str) -> None:
+        """Drop a token from the cache (e.g. on revocation)."""
+        self._cache.pop(key, None)
@@ -3,18 +3,15 @@
 import sys
 import os
 import asyncio
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
-from camarapsap.services.authorization import AuthorizationService
-from camarapsap.models.auth import Scope, TokenType
 
 
 async def main() -> None:
     """Test authorization service with JWT tokens."""
+    # Imported here so collecting this module doesn't load the service graph
+    from camarapsap.services.authorization import AuthorizationService
+    from camarapsap.models.auth import Scope
     
-    print("=" * 60)
-    print("Testing Authorization Service with JWT + Redis")
-    print("=" * 60)
+    print(f"{'=' * 60}\nTesting Authorization Service with JWT + Redis\n{'=' * 60}")
     
     # Initialize authorization service
     auth_service = AuthorizationService()
@@ -97,15 +94,16 @@ async def main() -> None:
     print("\n7. Token response format for API:")
     print(f"   {three_legged_token.to_dict()}")
     
-    print("\n" + "=" * 60)
-    print("Authorization tests completed successfully!")
-    print("=" * 60)
+    print(f"\n{'=' * 60}\nAuthorization tests completed successfully!\n{'=' * 60}")
     
     # Close Redis connection
     await auth_service.redis_client.close()
 
 
 if __name__ == "__main__":
+    # Block-buffer stdout even on a terminal instead of flushing every line
+    sys.stdout.reconfigure(line_buffering=False)
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
     try:
         asyncio.run(main())
     except Exception as e:
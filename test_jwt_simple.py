@@ -2,36 +2,32 @@
 
 import sys
 import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
+from functools import lru_cache
 import jwt
-from camarapsap.config import settings
-from camarapsap.models.auth import Scope, TokenType
 
 
-def create_simple_jwt(payload: dict, expires_in_minutes: int = 60) -> str:
-    """Create a JWT token without using the full service."""
-    now = datetime.now(timezone.utc)
-    payload.update({
-        "iat": now,
-        "exp": now + timedelta(minutes=expires_in_minutes),
-        "iss": "camarapsap"
-    })
+@lru_cache(maxsize=None)
+def _service():
+    """The authorization service, whose signing path the tokens go through."""
+    from camarapsap.services.authorization import AuthorizationService
     
-    token = jwt.encode(
-        payload,
-        settings.jwt_secret_key,
-        algorithm=settings.jwt_algorithm
-    )
+    return AuthorizationService()
+
+
+def create_simple_jwt(payload: dict, expires_in_minutes: int = 60) -> str:
+    """Create a JWT token without Redis, signed exactly as the service signs."""
+    token, _, _ = _service()._create_jwt_token(payload, expires_in_minutes, datetime.now(timezone.utc))
     return token
 
 
 def validate_simple_jwt(token: str) -> dict:
     """Validate a JWT token."""
+    from camarapsap.config import settings
+    
     return jwt.decode(
         token,
-        settings.jwt_secret_key,
+        _service()._verifying_key,
         algorithms=[settings.jwt_algorithm],
         options={"verify_exp": True}
     )
@@ -39,10 +35,11 @@ def validate_simple_jwt(token: str) -> dict:
 
 def main() -> None:
     """Test JWT token generation and validation."""
+    # Imported here so collecting this module doesn't load the package
+    from camarapsap.config import settings
+    from camarapsap.models.auth import Scope, TokenType
     
-    print("=" * 60)
-    print("Testing JWT Token Generation (No Redis)")
-    print("=" * 60)
+    print(f"{'=' * 60}\nTesting JWT Token Generation (No Redis)\n{'=' * 60}")
     
     # Test 2-legged token
     print("\n1. Creating 2-legged JWT token (client credentials)...")
@@ -133,14 +130,15 @@ def main() -> None:
     print(f"   - Access Token Expiry: {settings.jwt_access_token_expire_minutes} minutes")
     print(f"   - Refresh Token Expiry: {settings.jwt_refresh_token_expire_days} days")
     
-    print("\n" + "=" * 60)
-    print("JWT tests completed successfully!")
-    print("=" * 60)
+    print(f"\n{'=' * 60}\nJWT tests completed successfully!\n{'=' * 60}")
     print("\nNote: To test full authorization service with Redis revocation,")
     print("start the Redis service with: docker compose up -d redis")
 
 
 if __name__ == "__main__":
+    # Block-buffer stdout even on a terminal instead of flushing every line
+    sys.stdout.reconfigure(line_buffering=False)
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
     try:
         main()
     except Exception as e:
@@ -11,8 +11,7 @@ Note: Requires Redis to be running for full functionality.
 """
 
 import sys
-import time
-import requests
+import httpx
 from typing import Dict, Any
 
 
@@ -21,12 +20,10 @@ API_BASE_URL = "http://localhost:8000"
 
 def print_section(title: str):
     """Print a formatted section header."""
-    print("\n" + "=" * 60)
-    print(title)
-    print("=" * 60)
+    print(f"\n{'=' * 60}\n{title}\n{'=' * 60}")
 
 
-def print_response(response: requests.Response):
+def print_response(response: httpx.Response):
     """Print response details."""
     print(f"Status: {response.status_code}")
     if response.status_code < 400:
@@ -35,12 +32,12 @@ def print_response(response: requests.Response):
         print(f"Error: {response.text}")
 
 
-def get_2_legged_token() -> Dict[str, Any]:
+def get_2_legged_token(client: httpx.Client) -> Dict[str, Any]:
     """Obtain a 2-legged access token (client credentials flow)."""
     print_section("1. Obtaining 2-Legged Token (Client Credentials)")
     
-    response = requests.post(
-        f"{API_BASE_URL}/oauth/token",
+    response = client.post(
+        "/oauth/token",
         data={
             "grant_type": "client_credentials",
             "client_id": "test_client_123",
@@ -57,12 +54,12 @@ def get_2_legged_token() -> Dict[str, Any]:
         raise Exception(f"Failed to obtain token: {response.text}")
 
 
-def get_3_legged_token() -> Dict[str, Any]:
+def get_3_legged_token(client: httpx.Client) -> Dict[str, Any]:
     """Obtain a 3-legged access token (authorization code flow)."""
     print_section("2. Obtaining 3-Legged Token (Authorization Code)")
     
-    response = requests.post(
-        f"{API_BASE_URL}/oauth/token",
+    response = client.post(
+        "/oauth/token",
         data={
             "grant_type": "authorization_code",
             "client_id": "test_client_789",
@@ -95,13 +92,13 @@ def use_token_success(token_data: Dict[str, Any]):
     print("(See example_auth_integration.py for how to add auth to endpoints)")
 
 
-def use_token_wrong_scope():
+def use_token_wrong_scope(client: httpx.Client):
     """Try to use a token without the required scope."""
     print_section("4. Using Token Without Required Scope (Should Fail)")
     
     # Get token with limited scope
-    response = requests.post(
-        f"{API_BASE_URL}/oauth/token",
+    response = client.post(
+        "/oauth/token",
         data={
             "grant_type": "client_credentials",
             "client_id": "test_client",
@@ -117,14 +114,14 @@ def use_token_wrong_scope():
         print("(Would return 403 Forbidden if endpoint checks scopes)")
 
 
-def revoke_token(token_data: Dict[str, Any]):
+def revoke_token(client: httpx.Client, token_data: Dict[str, Any]):
     """Revoke an access token."""
     print_section("5. Revoking Token")
     
     access_token = token_data["access_token"]
     
-    response = requests.post(
-        f"{API_BASE_URL}/oauth/revoke",
+    response = client.post(
+        "/oauth/revoke",
         data={
             "token": access_token,
             "client_id": "test_client_123",
@@ -145,70 +142,65 @@ def use_revoked_token(token_data: Dict[str, Any]):
 def main():
     """Run the complete OAuth flow demonstration."""
     
-    print("=" * 60)
-    print("OAuth 2.0 Flow Demonstration")
-    print("=" * 60)
+    print(f"{'=' * 60}\nOAuth 2.0 Flow Demonstration\n{'=' * 60}")
     print("\nPrerequisites:")
     print("1. FastAPI server running: python -m camarapsap.main")
     print("   or: uvicorn camarapsap.main:app --reload")
     print("2. Redis running: docker compose up -d redis")
     print("   (for token revocation)")
     
-    # Check if server is running
-    try:
-        response = requests.get(f"{API_BASE_URL}/health", timeout=2)
-        if response.status_code != 200:
-            print("\n✗ Server health check failed")
+    # One pooled client so every step reuses the same keep-alive connection
+    with httpx.Client(base_url=API_BASE_URL) as client:
+        # Check if server is running
+        try:
+            response = client.get("/health", timeout=2)
+            if response.status_code != 200:
+                print("\n✗ Server health check failed")
+                print("  Start server: cd src && uvicorn camarapsap.main:app --reload")
+                return
+        except httpx.HTTPError:
+            print("\n✗ Cannot connect to API server")
             print("  Start server: cd src && uvicorn camarapsap.main:app --reload")
             return
-    except requests.exceptions.RequestException:
-        print("\n✗ Cannot connect to API server")
-        print("  Start server: cd src && uvicorn camarapsap.main:app --reload")
-        return
-    
-    print("\n✓ Server is running\n")
-    
-    try:
-        # Get 2-legged token
-        token_2_legged = get_2_legged_token()
-        time.sleep(1)
-        
-        # Get 3-legged token
-        token_3_legged = get_3_legged_token()
-        time.sleep(1)
-        
-        # Use token successfully
-        use_token_success(token_2_legged)
-        time.sleep(1)
-        
-        # Try wrong scope
-        use_token_wrong_scope()
-        time.sleep(1)
-        
-        # Revoke token
-        revoke_token(token_2_legged)
-        time.sleep(1)
-        
-        # Try to use revoked token
-        use_revoked_token(token_2_legged)
         
-        print("\n" + "=" * 60)
-        print("Demonstration Complete!")
-        print("=" * 60)
-        print("\nNext Steps:")
-        print("1. Add authentication to endpoints (see example_auth_integration.py)")
-        print("2. Implement client credential validation in oauth.py")
-        print("3. Add authorization code flow with user consent")
-        print("4. Set up proper JWT secret in production")
+        print("\n✓ Server is running\n")
         
-    except Exception as e:
-        print(f"\n✗ Error: {e}")
-        import traceback
-        traceback.print_exc()
-        return 1
+        try:
+            # Get 2-legged token
+            token_2_legged = get_2_legged_token(client)
+            
+            # Get 3-legged token
+            token_3_legged = get_3_legged_token(client)
+            
+            # Use token successfully
+            use_token_success(token_2_legged)
+            
+            # Try wrong scope
+            use_token_wrong_scope(client)
+            
+            # Revoke token
+            revoke_token(client, token_2_legged)
+            
+            # Try to use revoked token
+            use_revoked_token(token_2_legged)
+            
+            print(f"\n{'=' * 60}\nDemonstration Complete!\n{'=' * 60}")
+            print("\nNext Steps:")
+            print("1. Add authentication to endpoints (see example_auth_integration.py)")
+            print("2. Implement client credential validation in oauth.py")
+            print("3. Add authorization code flow with user consent")
+            print("4. Set up proper JWT secret in production")
+            
+        except Exception as e:
+            print(f"\n✗ Error: {e}")
+            import traceback
+            traceback.print_exc()
+            return 1
     
     return 0
 
 
 if __name__ == "__main__":
+    # Block-buffer stdout even on a terminal instead of flushing every line
+    sys.stdout.reconfigure(line_buffering=False)
     sys.exit(main())
@@ -0,0 +1,68 @@
+"""Tests for token revocation in AuthorizationService."""
+
+import fakeredis
+import pytest
+
+from camarapsap.models.auth import Scope
+from camarapsap.services.authorization import AuthorizationService, _token_cache_key
+
+SCOPES = [Scope.LOCATION_RETRIEVAL_READ.value]
+
+
+@pytest.fixture
+async def auth_service():
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    yield AuthorizationService(redis_client=client)
+    await client.aclose()
+
+
+async def _token(auth_service: AuthorizationService, client_id: str = "c1") -> str:
+    return (await auth_service.create_two_legged_token(client_id=client_id, scopes=SCOPES)).token
+
+
+async def test_revoke_many_revokes_valid_tokens_and_skips_invalid(auth_service):
+    first, second, kept = [await _token(auth_service) for _ in range(3)]
+    assert await auth_service.validate_token(first) is not None
+    
+    revoked = await auth_service.revoke_many([first, second, "not-a-jwt", "a.b.c", ""])
+    
+    assert revoked == 2
+    assert await auth_service.validate_token(first) is None
+    assert await auth_service.validate_token(second) is None
+    assert await auth_service.is_token_revoked(second)
+    assert await auth_service.validate_token(kept) is not None
+
+
+async def test_revoke_many_evicts_cached_validations(auth_service):
+    token = await _token(auth_service)
+    await auth_service.validate_token(token)
+    cache_key = _token_cache_key(token)
+    assert auth_service.token_cache.get(cache_key) is not None
+    
+    await auth_service.revoke_many([token])
+    
+    assert auth_service.token_cache.get(cache_key) is None
+    assert not await auth_service.redis_client.exists(cache_key)
+
+
+async def test_revoke_many_with_nothing_to_revoke(auth_service):
+    assert await auth_service.revoke_many([]) == 0
+    assert await auth_service.revoke_many(["garbage"]) == 0
+
+
+async def test_revoke_token_revokes_a_single_token(auth_service):
+    token = await _token(auth_service)
+    
+    assert await auth_service.revoke_token(token) is True
+    assert await auth_service.revoke_token("garbage") is False
+    assert await auth_service.validate_token(token) is None
+
+
+async def test_revoke_many_reports_nothing_when_redis_is_down():
+    server = fakeredis.FakeServer()
+    server.connected = False
+    auth_service = AuthorizationService(redis_client=fakeredis.FakeAsyncRedis(server=server))
+    token = await _token(auth_service)
+    
+    assert await auth_service.revoke_many([token]) == 0
+    assert not auth_service.revoked_tokens._revoked
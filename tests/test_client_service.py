@@ -0,0 +1,111 @@
+"""Tests for the client service and its caches."""
+
+import pytest
+from sqlalchemy import update
+
+from camarapsap.db.models.client import Client
+from camarapsap.models.auth import Scope
+from camarapsap.services import client as client_module
+from camarapsap.services.client import ClientService
+
+SCOPES = [Scope.LOCATION_RETRIEVAL_READ.value]
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Start every test with empty process-wide client caches."""
+    client_module._client_cache.clear()
+    client_module._authenticated_clients.clear()
+
+
+@pytest.fixture
+async def session(session_factory):
+    async with session_factory() as session:
+        yield session
+
+
+async def test_create_and_authenticate_client(session):
+    _, secret = await ClientService.create_client(session, "c1", "Client", SCOPES)
+    
+    client = await ClientService.authenticate_client(session, "c1", secret)
+    
+    assert client is not None
+    assert client.allowed_scopes == tuple(SCOPES)
+    assert client.allowed_scope_mask == Scope.LOCATION_RETRIEVAL_READ.mask
+    assert await ClientService.authenticate_client(session, "c1", "wrong") is None
+    assert await ClientService.authenticate_client(session, "missing", secret) is None
+
+
+async def test_get_client_is_served_from_cache(session, monkeypatch):
+    await ClientService.create_client(session, "c1", "Client", SCOPES, client_secret="s")
+    first = await ClientService.get_client(session, "c1")
+    
+    async def no_db(*args, **kwargs):
+        raise AssertionError("cached client should not query the database")
+    
+    monkeypatch.setattr(session, "execute", no_db)
+    assert await ClientService.get_client(session, "c1") is first
+
+
+async def test_authenticated_secret_skips_bcrypt(session, monkeypatch):
+    await ClientService.create_client(session, "c1", "Client", SCOPES, client_secret="s")
+    assert await ClientService.authenticate_client(session, "c1", "s") is not None
+    
+    def no_bcrypt(secret, hashed):
+        raise AssertionError("cached credentials should not be re-verified")
+    
+    monkeypatch.setattr(ClientService, "verify_secret", staticmethod(no_bcrypt))
+    assert await ClientService.authenticate_client(session, "c1", "s") is not None
+    # A different secret is not covered by the cache entry
+    with pytest.raises(AssertionError):
+        await ClientService.authenticate_client(session, "c1", "other")
+
+
+async def test_deactivate_client_invalidates_caches(session):
+    await ClientService.create_client(session, "c1", "Client", SCOPES, client_secret="s")
+    assert await ClientService.authenticate_client(session, "c1", "s") is not None
+    
+    assert await ClientService.deactivate_client(session, "c1") is True
+    
+    assert "c1" not in client_module._client_cache
+    assert await ClientService.authenticate_client(session, "c1", "s") is None
+    assert await ClientService.deactivate_client(session, "missing") is False
+
+
+async def test_change_from_another_process_rejects_cached_secret(session):
+    await ClientService.create_client(session, "c1", "Client", SCOPES, client_secret="s")
+    assert await ClientService.authenticate_client(session, "c1", "s") is not None
+    
+    # Deactivate behind the service's back, as another worker would, and let
+    # the short-lived client cache expire; the secret cache alone must not
+    # keep the client authenticating
+    await session.execute(update(Client).where(Client.client_id == "c1").values(is_active=False))
+    await session.commit()
+    client_module._client_cache.clear()
+    
+    assert await ClientService.authenticate_client(session, "c1", "s") is None
+
+
+async def test_rotated_secret_rejects_cached_secret(session):
+    await ClientService.create_client(session, "c1", "Client", SCOPES, client_secret="old")
+    assert await ClientService.authenticate_client(session, "c1", "old") is not None
+    
+    new_hash = ClientService.hash_secret("new")
+    await session.execute(
+        update(Client).where(Client.client_id == "c1").values(client_secret_hash=new_hash)
+    )
+    await session.commit()
+    client_module._client_cache.clear()
+    
+    assert await ClientService.authenticate_client(session, "c1", "old") is None
+    assert await ClientService.authenticate_client(session, "c1", "new") is not None
+
+
+async def test_validate_scopes(session):
+    await ClientService.create_client(session, "c1", "Client", SCOPES, client_secret="s")
+    client = await ClientService.get_client(session, "c1")
+    
+    assert await ClientService.validate_scopes(client, SCOPES)
+    assert not await ClientService.validate_scopes(
+        client, SCOPES + [Scope.LOCATION_VERIFICATION_VERIFY.value]
+    )
@@ -0,0 +1,125 @@
+"""Tests for device resolution and lookup batching."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import event
+
+from camarapsap.db.models import Device
+from camarapsap.models.common import Device as DeviceInput
+from camarapsap.services import device_lookup
+from camarapsap.services.device_lookup import DeviceLoader, find_device
+
+SHARED_IP = {"publicAddress": "198.51.100.1", "publicPort": 1}
+
+
+@pytest.fixture
+async def devices(session_factory):
+    """Two devices behind one NAT address and one reachable by NAI."""
+    async with session_factory() as session:
+        session.add_all([
+            Device(phone_number="+11111", imei="111111111111111", network_access_identifier="one@example.com"),
+            Device(phone_number="+22222", imei="222222222222222", ipv4_public_address="198.51.100.1"),
+            Device(phone_number="+33333", imei="333333333333333", ipv4_public_address="198.51.100.1"),
+        ])
+        await session.commit()
+
+
+@pytest.fixture
+def queries(session_factory):
+    """Running count of statements executed against the test database."""
+    count = [0]
+    
+    def on_execute(*args):
+        count[0] += 1
+    
+    engine = session_factory.kw["bind"].sync_engine
+    event.listen(engine, "before_cursor_execute", on_execute)
+    yield count
+    event.remove(engine, "before_cursor_execute", on_execute)
+
+
+def set_batch_window(monkeypatch, window_ms):
+    # Settings are frozen; give the module a copy instead
+    settings = device_lookup.settings.model_copy(update={"device_batch_window_ms": window_ms})
+    monkeypatch.setattr(device_lookup, "settings", settings)
+
+
+@pytest.fixture
+def batching(session_factory, monkeypatch):
+    """Route find_device through a loader bound to the test database."""
+    set_batch_window(monkeypatch, 2.0)
+    monkeypatch.setattr(device_lookup, "device_loader", DeviceLoader(session_factory, 0.002))
+
+
+INPUTS = [
+    DeviceInput(phoneNumber="+11111"),
+    DeviceInput(phoneNumber="+11111"),
+    DeviceInput(networkAccessIdentifier="one@example.com"),
+    DeviceInput(phoneNumber="+99999", ipv4Address=SHARED_IP),
+    DeviceInput(phoneNumber="+99999"),
+    DeviceInput(phoneNumber="+22222", networkAccessIdentifier="one@example.com"),
+]
+EXPECTED = [
+    ("+11111", "phoneNumber"),
+    ("+11111", "phoneNumber"),
+    ("+11111", "networkAccessIdentifier"),
+    # Shared NAT address: the lowest device id wins
+    ("+22222", "ipv4Address"),
+    (None, None),
+    ("+22222", "phoneNumber"),
+]
+
+
+async def resolve_all(session_factory, inputs):
+    async def resolve(device_input):
+        async with session_factory() as session:
+            device, matched_by = await find_device(session, device_input)
+            return (device.phone_number if device else None, matched_by)
+    
+    return await asyncio.gather(*map(resolve, inputs))
+
+
+@pytest.mark.usefixtures("devices")
+async def test_find_device_matches_by_priority(session_factory, monkeypatch):
+    set_batch_window(monkeypatch, 0.0)
+    assert await resolve_all(session_factory, INPUTS) == EXPECTED
+
+
+@pytest.mark.usefixtures("devices")
+async def test_find_device_is_memoized_per_session(session_factory, queries, monkeypatch):
+    set_batch_window(monkeypatch, 0.0)
+    async with session_factory() as session:
+        first = await find_device(session, DeviceInput(phoneNumber="+11111"))
+        executed = queries[0]
+        assert await find_device(session, DeviceInput(phoneNumber="+11111")) == first
+    
+    assert queries[0] == executed
+
+
+@pytest.mark.usefixtures("devices", "batching")
+async def test_loader_coalesces_concurrent_lookups(session_factory, queries):
+    assert await resolve_all(session_factory, INPUTS) == EXPECTED
+    assert queries[0] == 1
+    
+    # A later lookup starts a batch of its own
+    assert await resolve_all(session_factory, [DeviceInput(phoneNumber="+33333")]) == [("+33333", "phoneNumber")]
+    assert queries[0] == 2
+
+
+async def test_loader_fails_every_waiter_on_error():
+    class BrokenSession:
+        async def __aenter__(self):
+            raise RuntimeError("database unavailable")
+        
+        async def __aexit__(self, *args):
+            return False
+    
+    loader = DeviceLoader(lambda: BrokenSession(), 0.002)
+    results = await asyncio.gather(
+        loader.load(("+11111", None, None)),
+        loader.load((None, "one@example.com", None)),
+        return_exceptions=True,
+    )
+    
+    assert all(isinstance(result, RuntimeError) for result in results)
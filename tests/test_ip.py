@@ -0,0 +1,32 @@
+"""Tests for the shared IP address checks."""
+
+import ipaddress
+
+import pytest
+
+from camarapsap.models.common._ip import is_ipv4, is_ipv6
+
+
+@pytest.mark.parametrize("address", [
+    "1.2.3.4", "0.0.0.0", "255.255.255.255", "01.2.3.4", "1.2.3", "256.1.1.1", " 1.2.3.4", "",
+])
+def test_is_ipv4_matches_ipaddress(address):
+    try:
+        ipaddress.IPv4Address(address)
+        expected = True
+    except ValueError:
+        expected = False
+    assert is_ipv4(address) is expected
+
+
+@pytest.mark.parametrize("address", [
+    "2001:db8::1", "::ffff:1.2.3.4", "fe80::1%eth0", "fe80::1%1", "fe80::1%",
+    "fe80::1%eth0%x", "fe80::1%a/b", "1:2:3:4:5:6:7:8:9", "1.2.3.4", "",
+])
+def test_is_ipv6_matches_ipaddress(address):
+    try:
+        ipaddress.IPv6Address(address)
+        expected = True
+    except ValueError:
+        expected = False
+    assert is_ipv6(address) is expected
@@ -1,11 +1,8 @@
 """Tests for main module."""
 
-import pytest
 from camarapsap.main import main
 
 
-def test_main(capsys):
+def test_main():
     """Test main function."""
-    main()
-    captured = capsys.readouterr()
-    assert "Hello from CamaraPSAP!" in captured.out
+    assert main() == "Hello from CamaraPSAP!"
@@ -0,0 +1,65 @@
+"""Tests for Polygon.contains (PNPoly crossing test)."""
+
+import pytest
+
+from camarapsap.models.common.point import Point
+from camarapsap.models.location_retrieval.models import Polygon
+
+
+def _polygon(*vertices: tuple[float, float]) -> Polygon:
+    return Polygon(boundary=[Point(latitude=lat, longitude=lon) for lat, lon in vertices])
+
+
+def _square(lat: float, lon: float, size: float = 1.0) -> Polygon:
+    return _polygon((lat, lon), (lat, lon + size), (lat + size, lon + size), (lat + size, lon))
+
+
+SQUARE = _square(0.0, 0.0, 10.0)
+
+# A "C" shape opening to the east: the notch (lat 3-7, lon 5-10) is outside
+CONCAVE = _polygon((0, 0), (0, 10), (3, 10), (3, 5), (7, 5), (7, 10), (10, 10), (10, 0))
+
+
+@pytest.mark.parametrize("lat, lon", [(5, 5), (0.001, 0.001), (9.999, 9.999), (1, 9)])
+def test_points_inside(lat, lon):
+    assert SQUARE.contains(Point(latitude=lat, longitude=lon))
+
+
+@pytest.mark.parametrize("lat, lon", [(-1, 5), (11, 5), (5, -0.001), (5, 10.001), (20, 20)])
+def test_points_outside(lat, lon):
+    assert not SQUARE.contains(Point(latitude=lat, longitude=lon))
+
+
+@pytest.mark.parametrize("lat, lon, inside", [
+    (1.5, 8, True),  # upper arm
+    (8.5, 8, True),  # lower arm
+    (5, 2, True),  # spine
+    (5, 8, False),  # notch
+    (5, 5.001, False),  # just inside the notch
+    (5, 4.999, True),  # just inside the spine
+])
+def test_concave_polygon(lat, lon, inside):
+    assert CONCAVE.contains(Point(latitude=lat, longitude=lon)) is inside
+
+
+def test_triangle_ignores_bounding_box_corners():
+    triangle = _polygon((0, 0), (0, 10), (10, 0))
+    
+    assert triangle.contains(Point(latitude=2, longitude=2))
+    assert not triangle.contains(Point(latitude=8, longitude=8))
+
+
+def test_shared_vertex_belongs_to_exactly_one_polygon():
+    # Four squares meeting at (1, 1): the even-odd rule's half-open edges
+    # assign boundary points consistently, so the vertex is counted once
+    squares = [_square(lat, lon) for lat in (0.0, 1.0) for lon in (0.0, 1.0)]
+    vertex = Point(latitude=1, longitude=1)
+    
+    assert sum(square.contains(vertex) for square in squares) == 1
+
+
+def test_shared_edge_point_belongs_to_exactly_one_polygon():
+    lower, upper = _square(0.0, 0.0), _square(1.0, 0.0)
+    point = Point(latitude=1, longitude=0.5)
+    
+    assert lower.contains(point) != upper.contains(point)
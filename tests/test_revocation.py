@@ -0,0 +1,105 @@
+"""Tests for the in-process revocation mirror."""
+
+import asyncio
+
+import fakeredis
+import pytest
+
+from camarapsap.services.revocation import RevokedTokenSet
+
+
+async def _eventually(condition, timeout: float = 2.0) -> None:
+    """Wait for the background listener to catch up."""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not reached")
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+async def redis_client():
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    yield client
+    await client.aclose()
+
+
+@pytest.fixture
+def notifications_enabled(monkeypatch):
+    """fakeredis publishes keyspace events but has no CONFIG GET."""
+    async def enabled(self):
+        return True
+    
+    monkeypatch.setattr(RevokedTokenSet, "_notifications_enabled", enabled)
+
+
+async def test_mirror_loads_existing_and_follows_events(redis_client, notifications_enabled):
+    await redis_client.set("rt:old", "1")
+    revoked = RevokedTokenSet(redis_client)
+    revoked.ensure_started()
+    await _eventually(lambda: revoked.synced)
+    
+    assert "old" in revoked
+    
+    # Real Redis reports SETEX as a "set" event; fakeredis only does so for SET EX
+    await redis_client.set("rt:new", "1", ex=60)
+    await _eventually(lambda: "new" in revoked)
+    
+    await redis_client.delete("rt:old")
+    await _eventually(lambda: "old" not in revoked)
+    
+    # Keys outside the revocation prefix are ignored
+    await redis_client.set("other", "1")
+    await redis_client.set("rt:marker", "1")
+    await _eventually(lambda: "marker" in revoked)
+    assert "other" not in revoked
+    
+    revoked._task.cancel()
+
+
+async def test_local_add_is_visible_immediately(redis_client, notifications_enabled):
+    revoked = RevokedTokenSet(redis_client)
+    revoked.add("jti")
+    
+    assert "jti" in revoked
+
+
+def _server_config(monkeypatch, redis_client, events):
+    """Answer CONFIG GET with ``events`` and fail on any CONFIG SET."""
+    async def config_get(pattern):
+        return {"notify-keyspace-events": events}
+    
+    async def config_set(*args):
+        raise AssertionError("the mirror must not change server configuration")
+    
+    monkeypatch.setattr(redis_client, "config_get", config_get)
+    monkeypatch.setattr(redis_client, "config_set", config_set)
+
+
+async def test_mirror_stays_off_without_keyspace_events(redis_client, monkeypatch, caplog):
+    _server_config(monkeypatch, redis_client, "Kx")
+    revoked = RevokedTokenSet(redis_client)
+    revoked.ensure_started()
+    await revoked._task
+    
+    assert not revoked.synced
+    assert "notify-keyspace-events" in caplog.text
+
+
+@pytest.mark.parametrize("events", ["E$gx", "AE", "KEA"])
+async def test_configured_keyspace_events_are_detected(redis_client, monkeypatch, events):
+    _server_config(monkeypatch, redis_client, events)
+    
+    assert await RevokedTokenSet(redis_client)._notifications_enabled()
+
+
+async def test_mirror_stays_unsynced_when_config_is_refused(redis_client):
+    revoked = RevokedTokenSet(redis_client)
+    revoked.ensure_started()
+    task = revoked._task
+    await task
+    
+    assert not revoked.synced
+    # A failed listener is not restarted until the retry delay has passed
+    revoked.ensure_started()
+    assert revoked._task is task
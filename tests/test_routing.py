@@ -0,0 +1,102 @@
+"""Tests for RouteIndex dispatch: it must answer exactly like Starlette's scan."""
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from camarapsap import routing
+from camarapsap.dependencies import get_current_token
+from camarapsap.routing import FlatAPIRouter, RouteIndex, include_flat_routers, install_route_index
+
+
+def _build_app(indexed: bool, root_path: str = "") -> FastAPI:
+    app = FastAPI(root_path=root_path)
+    
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int) -> dict:
+        return {"read": item_id}
+    
+    @app.post("/items/{item_id}")
+    async def write_item(item_id: int) -> dict:
+        return {"write": item_id}
+    
+    @app.get("/items/special")
+    async def special() -> dict:
+        # Shadowed by /items/{item_id} for GET; reached by nothing else
+        return {"special": True}
+    
+    @app.get("/static/")
+    async def static() -> dict:
+        return {"static": True}
+    
+    @app.put("/static/")
+    async def put_static() -> dict:
+        return {"put": True}
+    
+    if indexed:
+        install_route_index(app)
+        assert isinstance(app.router.middleware_stack, RouteIndex)
+    return app
+
+
+REQUESTS = [
+    ("GET", "/items/1"),
+    ("POST", "/items/2"),
+    ("DELETE", "/items/3"),  # 405 with Allow header
+    ("GET", "/items/special"),  # first registered route wins (422: not an int)
+    ("GET", "/items/"),  # 404
+    ("GET", "/static/"),
+    ("PUT", "/static/"),
+    ("PATCH", "/static/"),  # 405
+    ("GET", "/static"),  # redirect to the slash form
+    ("GET", "/missing"),  # 404
+]
+
+
+def _responses(app: FastAPI, prefix: str = "") -> list[tuple]:
+    with TestClient(app, follow_redirects=False) as client:
+        return [
+            (response.status_code, response.headers.get("allow"),
+             response.headers.get("location"), response.content)
+            for response in (client.request(method, prefix + path) for method, path in REQUESTS)
+        ]
+
+
+@pytest.mark.parametrize("root_path", ["", "/api"])
+def test_route_index_matches_starlette(root_path):
+    expected = _responses(_build_app(False, root_path), root_path)
+    
+    assert _responses(_build_app(True, root_path), root_path) == expected
+
+
+def test_route_index_serves_routes_added_later():
+    app = _build_app(True)
+    
+    @app.get("/late")
+    async def late() -> dict:
+        return {"late": True}
+    
+    with TestClient(app) as client:
+        assert client.get("/late").json() == {"late": True}
+
+
+def test_flat_routes_follow_reassigned_dependency_overrides(monkeypatch):
+    monkeypatch.setattr(routing.dependency_overrides_provider, "_app", None)
+    router = FlatAPIRouter(prefix="/flat")
+    
+    @router.get("/whoami")
+    async def whoami(token=Depends(get_current_token)) -> dict:
+        return {"token": token}
+    
+    app = FastAPI()
+    include_flat_routers(app, router)
+    
+    with TestClient(app) as client:
+        assert client.get("/flat/whoami").status_code == 401
+        
+        # Replacing the whole dict, not mutating it, is the usual test idiom
+        app.dependency_overrides = {get_current_token: lambda: "overridden"}
+        assert client.get("/flat/whoami").json() == {"token": "overridden"}
+        
+        app.dependency_overrides = {}
+        assert client.get("/flat/whoami").status_code == 401
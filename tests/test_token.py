@@ -0,0 +1,47 @@
+"""Tests for the access token models."""
+
+from datetime import datetime, timedelta, timezone
+
+from camarapsap.models.auth import Scope, TokenType
+from camarapsap.models.auth.token import AccessToken, scopes_to_mask
+
+
+def test_each_scope_has_a_distinct_bit():
+    masks = [scope.mask for scope in Scope]
+    
+    assert all(mask and mask & (mask - 1) == 0 for mask in masks)
+    assert len(set(masks)) == len(masks)
+
+
+def test_scopes_to_mask_combines_bits():
+    mask = scopes_to_mask([
+        Scope.LOCATION_RETRIEVAL_READ.value,
+        Scope.DEVICE_IDENTIFIER_RETRIEVE_TYPE.value,
+    ])
+    
+    assert mask == Scope.LOCATION_RETRIEVAL_READ.mask | Scope.DEVICE_IDENTIFIER_RETRIEVE_TYPE.mask
+    assert mask & Scope.LOCATION_VERIFICATION_VERIFY.mask == 0
+
+
+def test_scopes_to_mask_ignores_unknown_and_duplicate_scopes():
+    read = Scope.LOCATION_RETRIEVAL_READ.value
+    
+    assert scopes_to_mask([]) == 0
+    assert scopes_to_mask(["unknown:scope"]) == 0
+    assert scopes_to_mask([read, read, "unknown:scope"]) == Scope.LOCATION_RETRIEVAL_READ.mask
+
+
+def test_access_token_scope_mask_matches_scopes():
+    scopes = [Scope.LOCATION_RETRIEVAL_READ.value, Scope.LOCATION_VERIFICATION_VERIFY.value]
+    token = AccessToken(
+        token="t",
+        token_type=TokenType.TWO_LEGGED,
+        expires_at=datetime.now(timezone.utc) + timedelta(minutes=5),
+        scopes=scopes,
+        client_id="c1",
+    )
+    
+    assert token.scope_mask == scopes_to_mask(scopes)
+    assert token.has_scope(Scope.LOCATION_RETRIEVAL_READ.value)
+    assert not token.has_scope(Scope.DEVICE_IDENTIFIER_RETRIEVE_PPID.value)
+    assert not token.is_expired()
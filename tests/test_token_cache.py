@@ -0,0 +1,50 @@
+"""Tests for the in-process access token cache."""
+
+from datetime import datetime, timedelta, timezone
+
+from camarapsap.models.auth import TokenType
+from camarapsap.models.auth.token import AccessToken
+from camarapsap.services.token_cache import AccessTokenCache
+
+
+def _token(expires_in: timedelta) -> AccessToken:
+    return AccessToken(
+        token="t",
+        token_type=TokenType.TWO_LEGGED,
+        expires_at=datetime.now(timezone.utc) + expires_in,
+        client_id="c1",
+    )
+
+
+def test_get_returns_cached_token():
+    cache = AccessTokenCache()
+    token = _token(timedelta(minutes=5))
+    cache.set("k", token)
+    
+    assert cache.get("k") is token
+    assert cache.get("other") is None
+
+
+def test_expired_token_is_dropped():
+    cache = AccessTokenCache()
+    cache.set("k", _token(timedelta(seconds=-1)))
+    
+    assert cache.get("k") is None
+    assert "k" not in cache._cache
+
+
+def test_delete_removes_token():
+    cache = AccessTokenCache()
+    cache.set("k", _token(timedelta(minutes=5)))
+    cache.delete("k")
+    cache.delete("missing")
+    
+    assert cache.get("k") is None
+
+
+def test_cache_is_bounded():
+    cache = AccessTokenCache(maxsize=2)
+    for key in ("a", "b", "c"):
+        cache.set(key, _token(timedelta(minutes=5)))
+    
+    assert len(cache._cache) == 2